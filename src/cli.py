@@ -1472,7 +1472,7 @@ async def cmd_module(args: argparse.Namespace) -> None:
         cookie_text = os.getenv("XIANYU_COOKIE_1", "")
         checker = CookieHealthChecker(cookie_text=cookie_text, timeout_seconds=10.0)
         result = checker.check_sync(force=True)
-        _json_out(result)
+        _json_out(dict(result))
         if not result.get("healthy", False):
             raise SystemExit(2)
         return
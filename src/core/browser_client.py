@@ -24,6 +24,10 @@ from dotenv import load_dotenv
 from src.core.error_handler import BrowserError
 from src.core.logger import get_logger
 
+# 浏览器启动后的就绪探测间隔（秒），指数退避；总等待（含探测请求）不超过 _READY_PROBE_BUDGET 秒
+_READY_PROBE_DELAYS = (0.05, 0.1, 0.2, 0.4, 0.5, 0.5, 0.25)
+_READY_PROBE_BUDGET = 2.0
+
 
 class BrowserState(Enum):
     DISCONNECTED = "disconnected"
@@ -32,7 +36,7 @@ class BrowserState(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class GatewayConfig:
     host: str = "127.0.0.1"
     gateway_port: int = 18789
@@ -126,7 +130,8 @@ class BrowserClient:
                 self.logger.info("Browser not running, starting...")
                 start_resp = await self._client.post("/start", params=self._profile_params())
                 if start_resp.status_code == 200:
-                    await asyncio.sleep(2)
+                    if not await self._wait_until_ready():
+                        self.logger.warning("Browser readiness probe timed out, assuming started")
                     self.state = BrowserState.CONNECTED
                     self.logger.info("OpenClaw browser started")
                     return True
@@ -146,6 +151,27 @@ class BrowserClient:
             self.logger.error(f"Connection failed: {e}")
             return False
 
+    async def _wait_until_ready(self) -> bool:
+        """/start 之后轮询 Gateway，浏览器就绪即返回；总等待不超过原先的固定 2 秒。"""
+        deadline = time.monotonic() + _READY_PROBE_BUDGET
+        for delay in _READY_PROBE_DELAYS:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                resp = await self._client.get(
+                    "/", params=self._profile_params(), timeout=min(max(delay, 0.25), remaining)
+                )
+            except httpx.HTTPError:
+                continue
+            if resp.status_code == 200:
+                return True
+        return False
+
     async def disconnect(self) -> None:
         for tab_id in list(self._tabs.keys()):
             await self.close_page(tab_id)
@@ -7,19 +7,268 @@ Configuration Management Module
 
 from __future__ import annotations
 
+import hashlib
 import os
+import re
 import threading
-from functools import lru_cache
+from collections.abc import Mapping
+from functools import cached_property, lru_cache
+from types import MappingProxyType
 from typing import Any
 
-import yaml
-from dotenv import load_dotenv
-from pydantic import ValidationError
-
-from src.core.config_models import ConfigModel
 from src.core.error_handler import ConfigError
 from src.core.logger import get_logger
 
+_SECTION_PROPERTIES = (
+    "app",
+    "openclaw",
+    "browser_runtime",
+    "ai",
+    "database",
+    "accounts",
+    "media",
+    "content",
+    "browser",
+    "messages",
+)
+
+_ENV_PATTERN = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+def _freeze(value: Any) -> Any:
+    """把嵌套的 dict/list 转为只读的 MappingProxyType/tuple。"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """_freeze 的逆操作，为每次加载生成可修改的新副本。"""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _overlay_defaults(defaults: Mapping[str, Any], loaded: dict[str, Any]) -> dict[str, Any]:
+    """以加载值覆盖默认段落；被覆盖的默认项不再复制，键顺序与 {**defaults, **loaded} 一致。"""
+    merged = {key: loaded[key] if key in loaded else _thaw(value) for key, value in defaults.items()}
+    merged.update(loaded)
+    return merged
+
+
+# 只读默认值：加载时只复制实际写入配置的默认项
+_DEFAULTS: Mapping[str, Mapping[str, Any]] = _freeze(
+    {
+        "app": {
+            "name": "xianyu-openclaw",
+            "version": "1.0.0",
+            "debug": False,
+            "log_level": "INFO",
+            "data_dir": "data",
+            "logs_dir": "logs",
+            "runtime": "auto",
+        },
+        "browser_runtime": {
+            "host": "localhost",
+            "port": 9222,
+            "timeout": 30,
+            "retry_times": 3,
+        },
+        "ai": {
+            "provider": "deepseek",
+            "temperature": 0.7,
+            "max_tokens": 1000,
+            "fallback_enabled": True,
+            "usage_mode": "minimal",
+            "max_calls_per_run": 20,
+            "cache_ttl_seconds": 900,
+            "cache_max_entries": 200,
+            "task_switches": {
+                "title": False,
+                "description": False,
+                "optimize_title": False,
+                "seo_keywords": False,
+            },
+        },
+        "database": {
+            "type": "sqlite",
+            "path": "data/agent.db",
+            "max_connections": 5,
+            "timeout": 30,
+        },
+        "browser": {
+            "headless": True,
+            "viewport": {"width": 1280, "height": 800},
+            "delay": {"min": 1, "max": 3},
+            "upload_timeout": 60,
+        },
+        "messages": {
+            "enabled": False,
+            "transport": "ws",
+            "ws": {
+                "base_url": "wss://wss-goofish.dingtalk.com/",
+                "heartbeat_interval_seconds": 15,
+                "heartbeat_timeout_seconds": 5,
+                "reconnect_delay_seconds": 3.0,
+                "message_expire_ms": 300000,
+                "max_queue_size": 200,
+                "queue_wait_seconds": 0.3,
+                "token_refresh_interval_seconds": 3600,
+                "token_retry_seconds": 300,
+                "auth_hold_until_cookie_update": True,
+            },
+            "max_replies_per_run": 10,
+            "reply_prefix": "",
+            "default_reply": "您好，宝贝在的，感兴趣可以直接拍下。",
+            "virtual_default_reply": "在的，这是虚拟商品，拍下后会尽快在聊天内给你处理结果。",
+            "virtual_product_keywords": [],
+            "intent_rules": [],
+            "keyword_replies": {},
+            "fast_reply_enabled": False,
+            "reply_target_seconds": 3.0,
+            "reuse_message_page": True,
+            "first_reply_delay_seconds": [0.25, 0.9],
+            "inter_reply_delay_seconds": [0.4, 1.2],
+            "send_confirm_delay_seconds": [0.15, 0.35],
+            "quote_intent_keywords": [
+                "报价",
+                "多少钱",
+                "价格",
+                "运费",
+                "邮费",
+                "快递费",
+                "寄到",
+                "发到",
+                "送到",
+                "怎么寄",
+            ],
+            "standard_format_trigger_keywords": ["你好", "您好", "在吗", "在不", "hi", "hello", "哈喽", "有人吗"],
+            "quote_missing_template": "询价格式：xx省 - xx省 - 重量（kg）\n长宽高（单位cm）",
+            "strict_format_reply_enabled": True,
+            "quote_reply_all_couriers": True,
+            "quote_reply_max_couriers": 10,
+            "quote_failed_template": "报价服务暂时繁忙，我先帮您转人工确认，确保价格准确。",
+            "quote": {},
+            "workflow": {},
+        },
+        "quote": {
+            "enabled": True,
+            "mode": "cost_table_plus_markup",
+            "ttl_seconds": 90,
+            "max_stale_seconds": 300,
+            "timeout_ms": 3000,
+            "retry_times": 1,
+            "circuit_fail_threshold": 3,
+            "circuit_open_seconds": 30,
+            "safety_margin": 0.0,
+            "validity_minutes": 30,
+            "analytics_log_enabled": True,
+            "pricing_profile": "normal",
+            "cost_table_dir": "data/quote_costs",
+            "cost_table_patterns": ["*.xlsx", "*.csv"],
+            "markup_rules": {},
+            "cost_api_url": "",
+            "cost_api_key_env": "QUOTE_COST_API_KEY",
+            "remote_api_url": "",
+            "remote_api_key_env": "QUOTE_API_KEY",
+            "api_fallback_to_table_parallel": True,
+            "api_prefer_max_wait_seconds": 1.2,
+            "volume_divisor_default": 6000,
+            "providers": {
+                "remote": {
+                    "enabled": False,
+                    "allow_mock": False,
+                    "simulated_latency_ms": 120,
+                    "failure_rate": 0.0,
+                }
+            },
+        },
+    }
+)
+
+
+_VALIDATED_CACHE_SIZE = 4
+_VALIDATED_CACHE: dict[tuple[str, int, int], tuple[bytes, Any]] = {}
+
+
+def _find_validated(path: str, digest: bytes) -> Any | None:
+    """按文件内容摘要查找已校验的配置（文件被改写但内容相同时命中）。"""
+    for (cached_path, *_), (cached_digest, frozen) in list(_VALIDATED_CACHE.items()):
+        if cached_path == path and cached_digest == digest:
+            return frozen
+    return None
+
+
+def _remember_validated(cache_key: tuple[str, int, int], digest: bytes, frozen: Any) -> None:
+    """缓存校验通过的配置（冻结副本），超出容量时淘汰最早的条目。"""
+    while len(_VALIDATED_CACHE) >= _VALIDATED_CACHE_SIZE:
+        _VALIDATED_CACHE.pop(next(iter(_VALIDATED_CACHE)), None)
+    _VALIDATED_CACHE[cache_key] = (digest, frozen)
+
+
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> tuple[str, ...]:
+    """拆分点号路径并把 openclaw 前缀映射到 browser_runtime，结果按键缓存。"""
+    keys = key.split(".")
+    if keys[0] == "openclaw":
+        keys[0] = "browser_runtime"
+    return tuple(keys)
+
+
+@lru_cache(maxsize=1)
+def _yaml_loader() -> type:
+    """
+    首次解析时导入 yaml 并选择加载器，优先使用 libyaml 的 CSafeLoader
+    """
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:  # pragma: no cover - 未编译 libyaml 时回退纯 Python 解析器
+        from yaml import SafeLoader as loader
+    return loader
+
+
+def _file_stamp(path: str) -> tuple[int, int] | None:
+    """返回文件的 (mtime_ns, size)，文件不存在时返回 None。"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+@lru_cache(maxsize=16)
+def _dir_entries(cwd: str, directory: str) -> frozenset[str]:
+    """列出目录下的文件名（一次 scandir），按工作目录缓存，reload() 时清空。"""
+    try:
+        with os.scandir(directory or ".") as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def _first_existing(cwd: str, paths: tuple[str, ...]) -> str | None:
+    for path in paths:
+        directory, name = os.path.split(path)
+        if name in _dir_entries(cwd, directory):
+            return path
+    return None
+
+
+@lru_cache(maxsize=8)
+def _resolve_config_path(cwd: str) -> str | None:
+    """按工作目录缓存默认配置文件的探测结果，reload() 时清空。"""
+    return _first_existing(cwd, ("config/config.yaml", "config/config.example.yaml"))
+
+
+@lru_cache(maxsize=8)
+def _resolve_env_path(cwd: str) -> str | None:
+    """按工作目录缓存 .env 文件的探测结果，reload() 时清空。"""
+    return _first_existing(cwd, (".env", "config/.env"))
+
 
 class Config:
     """
@@ -29,28 +278,35 @@ class Config:
     """
 
     _instance: Config | None = None
-    _lock = threading.Lock()
+    _lock = threading.RLock()
+    _initialized: bool = False
     _config: dict[str, Any] = {}
     _config_path: str | None = None
 
     def __new__(cls, config_path: str | None = None):
-        if cls._instance is None:
+        instance = cls._instance
+        if instance is None:  # 单例在模块导入时预建，仅在被显式重置后才走加锁路径
             with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
+                instance = cls._instance
+                if instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
+        return instance
 
     def __init__(self, config_path: str | None = None):
-        default_path = self._find_config_file()
-        if not hasattr(self, "_initialized") or not self._initialized:
-            self.logger = get_logger()
-            self._load_config(config_path)
-            self._initialized = True
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    self.logger = get_logger()
+                    self._load_config(config_path)
+                    self._initialized = True
+        elif config_path is None:
+            default_path = self._find_config_file()
+            if self._config_path != default_path:
+                self.reload(default_path)
         elif config_path and config_path != self._config_path:
             self.reload(config_path)
-        elif config_path is None and self._config_path != default_path:
-            self.reload(default_path)
 
     def _load_config(self, config_path: str | None = None) -> None:
         """
@@ -63,9 +319,10 @@ class Config:
             config_path = self._find_config_file()
 
         self._config_path = config_path
+        stamp = _file_stamp(config_path) if config_path else None
 
-        if config_path and os.path.exists(config_path):
-            self._load_yaml_config(config_path)
+        if stamp is not None:
+            self._load_yaml_config(config_path, stamp)
             self._load_env_file()
             self._resolve_env_variables()
             self._set_defaults()
@@ -83,28 +340,48 @@ class Config:
 
         优先级: config/config.yaml > config/config.example.yaml
         """
-        possible_paths = [
-            "config/config.yaml",
-            "config/config.example.yaml",
-        ]
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-        return None
+        return _resolve_config_path(os.getcwd())
 
-    def _load_yaml_config(self, config_path: str) -> None:
+    def _load_yaml_config(self, config_path: str, stamp: tuple[int, int] | None = None) -> None:
         """
         加载YAML配置文件
+
+        文件 (路径, mtime, size) 或内容摘要未变化时直接复用上次校验通过的结果，跳过解析与校验
         """
+        if stamp is None:
+            stamp = _file_stamp(config_path)
+        abs_path = os.path.abspath(config_path)
+        cache_key = (abs_path, *stamp) if stamp is not None else None
+        cached = _VALIDATED_CACHE.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            self._config = _thaw(cached[1])
+            return
+
+        import yaml
+        from pydantic import ValidationError
+
+        from src.core.config_models import ConfigModel
+
         try:
-            with open(config_path, encoding="utf-8") as f:
-                config_data = yaml.safe_load(f) or {}
+            with open(config_path, "rb") as f:
+                raw = f.read()
+            digest = hashlib.blake2b(raw, digest_size=16).digest()
+            frozen = _find_validated(abs_path, digest)
+            if frozen is not None:
+                self._config = _thaw(frozen)
+                if cache_key is not None:
+                    _remember_validated(cache_key, digest, frozen)
+                return
+
+            config_data = yaml.load(raw, Loader=_yaml_loader()) or {}
 
             if config_data:
                 try:
                     validated_config = ConfigModel.from_dict(config_data)
                     self._config = validated_config.to_dict()
                     self.logger.debug(f"Config validation passed: {config_path}")
+                    if cache_key is not None:
+                        _remember_validated(cache_key, digest, _freeze(self._config))
                 except ValidationError as e:
                     self.logger.error(f"Config validation failed: {e}")
                     raise ConfigError(f"Invalid configuration: {e}") from e
@@ -123,14 +400,11 @@ class Config:
         """
         加载.env环境变量文件
         """
-        env_files = [
-            ".env",
-            "config/.env",
-        ]
-        for env_file in env_files:
-            if os.path.exists(env_file):
-                load_dotenv(env_file, override=False)
-                break
+        from dotenv import load_dotenv
+
+        env_file = _resolve_env_path(os.getcwd())
+        if env_file:
+            load_dotenv(env_file, override=False)
 
     def _resolve_env_variables(self) -> None:
         """
@@ -138,166 +412,69 @@ class Config:
 
         将配置中的 ${VAR_NAME} 替换为实际的环境变量值
         """
-        self._config = self._resolve_dict(self._config)
+        self._config = self._resolve_dict(self._config, {})
 
-    def _resolve_dict(self, obj: Any) -> Any:
+    def _resolve_dict(self, obj: Any, env_cache: dict[str, str | None] | None = None) -> Any:
         """
-        递归解析字典中的环境变量引用
+        解析配置树中的环境变量引用
+
+        使用显式栈迭代遍历，容器原地更新，仅替换发生变化的字符串；env_cache 在单次解析内缓存变量查询结果
         """
-        if isinstance(obj, dict):
-            resolved = {}
-            for key, value in obj.items():
-                resolved[key] = self._resolve_dict(value)
-            return resolved
-        elif isinstance(obj, list):
-            return [self._resolve_dict(item) for item in obj]
-        elif isinstance(obj, str) and obj.startswith("${") and obj.endswith("}"):
-            env_key = obj[2:-1]
-            value = os.getenv(env_key)
+        if env_cache is None:
+            env_cache = {}
+
+        def substitute(match: re.Match[str]) -> str:
+            return self._substitute_env(match, env_cache)
+
+        sub = _ENV_PATTERN.sub
+        if isinstance(obj, str):
+            return sub(substitute, obj) if "$" in obj else obj
+        if not isinstance(obj, (dict, list)):
+            return obj
+
+        stack: list[dict[str, Any] | list[Any]] = [obj]
+        while stack:
+            node = stack.pop()
+            for key, value in node.items() if isinstance(node, dict) else enumerate(node):
+                if isinstance(value, str):
+                    if "$" in value:
+                        resolved = sub(substitute, value)
+                        if resolved is not value:
+                            node[key] = resolved
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+        return obj
+
+    def _substitute_env(self, match: re.Match[str], env_cache: dict[str, str | None]) -> str:
+        """
+        替换单个 ${VAR_NAME} 占位符，变量缺失时保留原文
+        """
+        env_key = match.group(1)
+        if env_key in env_cache:
+            value = env_cache[env_key]
+        else:
+            value = env_cache[env_key] = os.environ.get(env_key)
             if value is None:
                 self.logger.warning(f"Environment variable {env_key} not found, using placeholder")
-                return obj
-            return value
-        return obj
+        if value is None:
+            return match.group(0)
+        return value
 
     def _set_defaults(self) -> None:
         """
         设置默认配置值
         """
-        defaults = {
-            "app": {
-                "name": "xianyu-openclaw",
-                "version": "1.0.0",
-                "debug": False,
-                "log_level": "INFO",
-                "data_dir": "data",
-                "logs_dir": "logs",
-                "runtime": "auto",
-            },
-            "browser_runtime": {
-                "host": "localhost",
-                "port": 9222,
-                "timeout": 30,
-                "retry_times": 3,
-            },
-            "ai": {
-                "provider": "deepseek",
-                "temperature": 0.7,
-                "max_tokens": 1000,
-                "fallback_enabled": True,
-                "usage_mode": "minimal",
-                "max_calls_per_run": 20,
-                "cache_ttl_seconds": 900,
-                "cache_max_entries": 200,
-                "task_switches": {
-                    "title": False,
-                    "description": False,
-                    "optimize_title": False,
-                    "seo_keywords": False,
-                },
-            },
-            "database": {
-                "type": "sqlite",
-                "path": "data/agent.db",
-                "max_connections": 5,
-                "timeout": 30,
-            },
-            "browser": {
-                "headless": True,
-                "viewport": {"width": 1280, "height": 800},
-                "delay": {"min": 1, "max": 3},
-                "upload_timeout": 60,
-            },
-            "messages": {
-                "enabled": False,
-                "transport": "ws",
-                "ws": {
-                    "base_url": "wss://wss-goofish.dingtalk.com/",
-                    "heartbeat_interval_seconds": 15,
-                    "heartbeat_timeout_seconds": 5,
-                    "reconnect_delay_seconds": 3.0,
-                    "message_expire_ms": 300000,
-                    "max_queue_size": 200,
-                    "queue_wait_seconds": 0.3,
-                    "token_refresh_interval_seconds": 3600,
-                    "token_retry_seconds": 300,
-                    "auth_hold_until_cookie_update": True,
-                },
-                "max_replies_per_run": 10,
-                "reply_prefix": "",
-                "default_reply": "您好，宝贝在的，感兴趣可以直接拍下。",
-                "virtual_default_reply": "在的，这是虚拟商品，拍下后会尽快在聊天内给你处理结果。",
-                "virtual_product_keywords": [],
-                "intent_rules": [],
-                "keyword_replies": {},
-                "fast_reply_enabled": False,
-                "reply_target_seconds": 3.0,
-                "reuse_message_page": True,
-                "first_reply_delay_seconds": [0.25, 0.9],
-                "inter_reply_delay_seconds": [0.4, 1.2],
-                "send_confirm_delay_seconds": [0.15, 0.35],
-                "quote_intent_keywords": [
-                    "报价",
-                    "多少钱",
-                    "价格",
-                    "运费",
-                    "邮费",
-                    "快递费",
-                    "寄到",
-                    "发到",
-                    "送到",
-                    "怎么寄",
-                ],
-                "standard_format_trigger_keywords": ["你好", "您好", "在吗", "在不", "hi", "hello", "哈喽", "有人吗"],
-                "quote_missing_template": "询价格式：xx省 - xx省 - 重量（kg）\n长宽高（单位cm）",
-                "strict_format_reply_enabled": True,
-                "quote_reply_all_couriers": True,
-                "quote_reply_max_couriers": 10,
-                "quote_failed_template": "报价服务暂时繁忙，我先帮您转人工确认，确保价格准确。",
-                "quote": {},
-                "workflow": {},
-            },
-            "quote": {
-                "enabled": True,
-                "mode": "cost_table_plus_markup",
-                "ttl_seconds": 90,
-                "max_stale_seconds": 300,
-                "timeout_ms": 3000,
-                "retry_times": 1,
-                "circuit_fail_threshold": 3,
-                "circuit_open_seconds": 30,
-                "safety_margin": 0.0,
-                "validity_minutes": 30,
-                "analytics_log_enabled": True,
-                "pricing_profile": "normal",
-                "cost_table_dir": "data/quote_costs",
-                "cost_table_patterns": ["*.xlsx", "*.csv"],
-                "markup_rules": {},
-                "cost_api_url": "",
-                "cost_api_key_env": "QUOTE_COST_API_KEY",
-                "remote_api_url": "",
-                "remote_api_key_env": "QUOTE_API_KEY",
-                "api_fallback_to_table_parallel": True,
-                "api_prefer_max_wait_seconds": 1.2,
-                "volume_divisor_default": 6000,
-                "providers": {
-                    "remote": {
-                        "enabled": False,
-                        "allow_mock": False,
-                        "simulated_latency_ms": 120,
-                        "failure_rate": 0.0,
-                    }
-                },
-            },
-        }
-
-        for section, values in defaults.items():
-            if section not in self._config:
-                self._config[section] = values
-            elif isinstance(values, dict):
-                for key, value in values.items():
-                    if key not in self._config[section]:
-                        self._config[section][key] = value
+        current = self._config
+        self._config = {
+            section: (
+                _overlay_defaults(values, existing)
+                if isinstance(existing := current.get(section), dict)
+                else _thaw(values)
+                if existing is None
+                else existing
+            )
+            for section, values in _DEFAULTS.items()
+        } | {key: value for key, value in current.items() if key not in _DEFAULTS}
 
         if "browser_runtime" not in self._config and "openclaw" in self._config:
             self._config["browser_runtime"] = dict(self._config["openclaw"])
@@ -361,18 +538,12 @@ class Config:
         Returns:
             配置值
         """
-        alias_map = {"openclaw": "browser_runtime"}
-        keys = key.split(".")
-        if keys and keys[0] in alias_map:
-            keys[0] = alias_map[keys[0]]
         value = self._config
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
+        try:
+            for k in _split_key(key):
                 value = value[k]
-            else:
-                return default
-
+        except (KeyError, TypeError):
+            return default
         return value
 
     def get_section(self, section: str, default: dict[str, Any] | None = None) -> dict[str, Any]:
@@ -386,58 +557,61 @@ class Config:
         Returns:
             配置段落字典
         """
+        config = self._config
         if section == "openclaw":
             section = "browser_runtime"
-        if section == "browser_runtime" and section not in self._config and "openclaw" in self._config:
-            return self._config.get("openclaw", default or {})
-        return self._config.get(section, default or {})
+        if section in config:
+            return config[section]
+        if section == "browser_runtime" and "openclaw" in config:
+            return config["openclaw"]
+        return default or {}
 
-    @property
+    @cached_property
     def app(self) -> dict[str, Any]:
         """应用配置"""
         return self.get_section("app")
 
-    @property
+    @cached_property
     def openclaw(self) -> dict[str, Any]:
         """兼容旧字段名。"""
         return self.get_section("browser_runtime")
 
-    @property
+    @cached_property
     def browser_runtime(self) -> dict[str, Any]:
         """浏览器运行时配置"""
         return self.get_section("browser_runtime")
 
-    @property
+    @cached_property
     def ai(self) -> dict[str, Any]:
         """AI服务配置"""
         return self.get_section("ai")
 
-    @property
+    @cached_property
     def database(self) -> dict[str, Any]:
         """数据库配置"""
         return self.get_section("database")
 
-    @property
+    @cached_property
     def accounts(self) -> list:
         """账号配置"""
         return self.get_section("accounts", [])
 
-    @property
+    @cached_property
     def media(self) -> dict[str, Any]:
         """媒体处理配置"""
         return self.get_section("media", {})
 
-    @property
+    @cached_property
     def content(self) -> dict[str, Any]:
         """内容生成配置"""
         return self.get_section("content", {})
 
-    @property
+    @cached_property
     def browser(self) -> dict[str, Any]:
         """浏览器配置"""
         return self.get_section("browser", {})
 
-    @property
+    @cached_property
     def messages(self) -> dict[str, Any]:
         """消息自动回复配置"""
         return self.get_section("messages", {})
@@ -449,19 +623,33 @@ class Config:
         Args:
             config_path: 新的配置文件路径
         """
+        _dir_entries.cache_clear()
+        _resolve_config_path.cache_clear()
+        _resolve_env_path.cache_clear()
         self._config = {}
+        for name in _SECTION_PROPERTIES:
+            self.__dict__.pop(name, None)
         self._load_config(config_path or self._config_path)
 
 
-@lru_cache(maxsize=1)
+# 模块导入由导入锁串行化，在此预建单例对象，__new__ 的常规路径只需一次属性读取
+Config._instance = object.__new__(Config)
+
+
 def get_config(config_path: str | None = None) -> Config:
     """
     获取配置单例
 
+    未指定路径且单例已初始化时直接返回，不加锁。
+
     Args:
         config_path: 配置文件路径
 
     Returns:
         Config实例
     """
-    return Config(config_path)
+    instance = Config._instance
+    if config_path is None and instance is not None and instance._initialized:
+        return instance
+    with Config._lock:
+        return Config(config_path)
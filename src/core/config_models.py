@@ -7,10 +7,64 @@ Configuration Models and Validation
 
 from __future__ import annotations
 
+import sys
 from enum import Enum
-from typing import Any
-
-from pydantic import BaseModel, Field, field_validator
+from functools import lru_cache
+from typing import Annotated, Any, TypeVar
+
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, TypeAdapter
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+_VALID_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_VALID_LOG_LEVEL_SET = frozenset(_VALID_LOG_LEVELS)
+_LOG_LEVEL_ERROR = f"log_level must be one of {list(_VALID_LOG_LEVELS)}, got {{}}"
+_VALID_RUNTIMES = frozenset({"auto", "lite", "pro"})
+_RUNTIME_ERROR = f"runtime must be one of {sorted(_VALID_RUNTIMES)}, got {{}}"
+_VALID_TRANSPORTS = frozenset({"dom", "ws", "auto"})
+_TRANSPORT_ERROR = "messages.transport must be one of dom|ws|auto"
+
+
+def _choice(valid: frozenset[str], error: str, *, normalize: bool = False, fallback: str = "") -> AfterValidator:
+    """
+    构建枚举型字符串字段的校验器
+
+    已是规范值时直接返回；否则可选地以 fallback 替代空值、去空白并转小写。
+    合法时返回驻留后的规范值，否则以 error.format(原值) 报错。
+    """
+
+    def check(v: str) -> str:
+        if v in valid:
+            return sys.intern(v)
+        value = v or fallback
+        if normalize:
+            value = value.strip().lower()
+        if value not in valid:
+            raise ValueError(error.format(v))
+        return sys.intern(value)
+
+    return AfterValidator(check)
+
+
+_LOG_LEVEL_CHOICE = _choice(_VALID_LOG_LEVEL_SET, _LOG_LEVEL_ERROR)
+_RUNTIME_CHOICE = _choice(_VALID_RUNTIMES, _RUNTIME_ERROR, normalize=True)
+_TRANSPORT_CHOICE = _choice(_VALID_TRANSPORTS, _TRANSPORT_ERROR, normalize=True, fallback="dom")
+
+# 默认值模板：default_factory 直接使用绑定的 .copy，每个实例得到独立副本
+_DEFAULT_TASK_SWITCHES = {
+    "title": False,
+    "description": False,
+    "optimize_title": False,
+    "seo_keywords": False,
+}
+_DEFAULT_SUPPORTED_FORMATS = ["jpg", "jpeg", "png", "webp"]
+_DEFAULT_VIEWPORT = {"width": 1280, "height": 800}
+_DEFAULT_DELAY = {"min": 1.0, "max": 3.0}
+_DEFAULT_FIRST_REPLY_DELAY = [0.25, 0.9]
+_DEFAULT_INTER_REPLY_DELAY = [0.4, 1.2]
+_DEFAULT_SEND_CONFIRM_DELAY = [0.15, 0.35]
+_DEFAULT_QUOTE_INTENT_KEYWORDS = ["报价", "多少钱", "价格", "运费", "邮费", "快递费", "寄到", "发到", "送到", "怎么寄"]
+_DEFAULT_STANDARD_FORMAT_TRIGGER_KEYWORDS = ["你好", "您好", "在吗", "在不", "hi", "hello", "哈喽", "有人吗"]
 
 
 class Provider(str, Enum):
@@ -25,7 +79,13 @@ class Provider(str, Enum):
     ZHIPU = "zhipu"
 
 
-class BrowserRuntimeConfig(BaseModel):
+class _ConfigBase(BaseModel):
+    """配置模型基类：加载后只读，核心 schema 推迟到首次使用时构建"""
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+
+class BrowserRuntimeConfig(_ConfigBase):
     """浏览器运行时配置模型（兼容 legacy gateway 端口配置）"""
 
     host: str = "localhost"
@@ -37,7 +97,7 @@ class BrowserRuntimeConfig(BaseModel):
 OpenClawConfig = BrowserRuntimeConfig
 
 
-class AIConfig(BaseModel):
+class AIConfig(_ConfigBase):
     """AI服务配置模型"""
 
     provider: Provider = Provider.DEEPSEEK
@@ -51,21 +111,13 @@ class AIConfig(BaseModel):
     fallback_api_key: str | None = Field(default=None, description="备用API密钥")
     fallback_model: str = Field(default="gpt-3.5-turbo", description="备用模型")
     usage_mode: str = Field(default="minimal", description="AI调用模式：always|auto|minimal")
-    max_calls_per_run: int = Field(default=20, ge=1, le=500, description="单次运行最大AI调用数")
-    cache_ttl_seconds: int = Field(default=900, ge=30, le=86400, description="本地响应缓存TTL")
-    cache_max_entries: int = Field(default=200, ge=10, le=5000, description="本地响应缓存容量")
-    task_switches: dict[str, bool] = Field(
-        default_factory=lambda: {
-            "title": False,
-            "description": False,
-            "optimize_title": False,
-            "seo_keywords": False,
-        },
-        description="任务级AI开关",
-    )
+    max_calls_per_run: int = Field(default=20, ge=1, description="单次运行最大AI调用数")
+    cache_ttl_seconds: int = Field(default=900, ge=30, description="本地响应缓存TTL")
+    cache_max_entries: int = Field(default=200, ge=10, description="本地响应缓存容量")
+    task_switches: dict[str, bool] = Field(default_factory=_DEFAULT_TASK_SWITCHES.copy, description="任务级AI开关")
 
 
-class DatabaseConfig(BaseModel):
+class DatabaseConfig(_ConfigBase):
     """数据库配置模型"""
 
     type: str = Field(default="sqlite", description="数据库类型")
@@ -74,7 +126,7 @@ class DatabaseConfig(BaseModel):
     timeout: int = Field(default=30, ge=1, le=300, description="数据库操作超时时间（秒）")
 
 
-class AccountConfig(BaseModel):
+class AccountConfig(_ConfigBase):
     """账号配置模型"""
 
     id: str = Field(..., description="账号ID")
@@ -84,7 +136,7 @@ class AccountConfig(BaseModel):
     enabled: bool = Field(default=True, description="是否启用")
 
 
-class SchedulerConfig(BaseModel):
+class SchedulerConfig(_ConfigBase):
     """调度器配置模型"""
 
     enabled: bool = Field(default=True, description="是否启用调度器")
@@ -93,11 +145,11 @@ class SchedulerConfig(BaseModel):
     metrics: dict[str, Any] | None = Field(default=None, description="数据采集任务配置")
 
 
-class MediaConfig(BaseModel):
+class MediaConfig(_ConfigBase):
     """媒体处理配置模型"""
 
     max_image_size: int = Field(default=5242880, ge=1024, le=10485760, description="最大图片大小（字节）")
-    supported_formats: list[str] = Field(default=["jpg", "jpeg", "png", "webp"], description="支持的图片格式")
+    supported_formats: list[str] = Field(default_factory=_DEFAULT_SUPPORTED_FORMATS.copy, description="支持的图片格式")
     output_format: str = Field(default="jpeg", description="输出格式")
     output_quality: int = Field(default=85, ge=1, le=100, description="输出质量")
     max_width: int = Field(default=1500, ge=100, le=4000, description="最大宽度")
@@ -105,7 +157,7 @@ class MediaConfig(BaseModel):
     watermark: dict[str, Any] | None = Field(default=None, description="水印配置")
 
 
-class ContentConfig(BaseModel):
+class ContentConfig(_ConfigBase):
     """内容生成配置模型"""
 
     title: dict[str, Any] | None = Field(default=None, description="标题生成配置")
@@ -113,23 +165,23 @@ class ContentConfig(BaseModel):
     templates: dict[str, Any] | None = Field(default=None, description="模板配置")
 
 
-class BrowserConfig(BaseModel):
+class BrowserConfig(_ConfigBase):
     """浏览器配置模型"""
 
     headless: bool = Field(default=True, description="是否无头模式")
     user_agent: str | None = Field(default=None, description="用户代理")
-    viewport: dict[str, int] = Field(default={"width": 1280, "height": 800}, description="视口大小")
-    delay: dict[str, float] = Field(default={"min": 1.0, "max": 3.0}, description="操作延迟范围（秒）")
+    viewport: dict[str, int] = Field(default_factory=_DEFAULT_VIEWPORT.copy, description="视口大小")
+    delay: dict[str, float] = Field(default_factory=_DEFAULT_DELAY.copy, description="操作延迟范围（秒）")
     upload_timeout: int = Field(default=60, ge=10, le=300, description="文件上传超时时间（秒）")
 
 
-class MessagesConfig(BaseModel):
+class MessagesConfig(_ConfigBase):
     """消息自动回复配置模型"""
 
     enabled: bool = Field(default=False, description="是否启用消息自动回复")
-    transport: str = Field(default="ws", description="消息通道：dom|ws|auto")
+    transport: Annotated[str, _TRANSPORT_CHOICE] = Field(default="ws", description="消息通道：dom|ws|auto")
     ws: dict[str, Any] = Field(default_factory=dict, description="WebSocket 通道配置")
-    max_replies_per_run: int = Field(default=10, ge=1, le=200, description="单次最多自动回复数量")
+    max_replies_per_run: int = Field(default=10, ge=1, description="单次最多自动回复数量")
     reply_prefix: str = Field(default="", description="回复前缀")
     default_reply: str = Field(default="您好，宝贝在的，感兴趣可以直接拍下。", description="默认回复文案")
     virtual_default_reply: str = Field(
@@ -143,23 +195,23 @@ class MessagesConfig(BaseModel):
     reply_target_seconds: float = Field(default=3.0, ge=0.5, le=20.0, description="自动回复目标时延")
     reuse_message_page: bool = Field(default=True, description="是否复用消息页")
     first_reply_delay_seconds: list[float] = Field(
-        default_factory=lambda: [0.25, 0.9],
+        default_factory=_DEFAULT_FIRST_REPLY_DELAY.copy,
         description="首条回复抖动延迟范围",
     )
     inter_reply_delay_seconds: list[float] = Field(
-        default_factory=lambda: [0.4, 1.2],
+        default_factory=_DEFAULT_INTER_REPLY_DELAY.copy,
         description="会话间回复延迟范围",
     )
     send_confirm_delay_seconds: list[float] = Field(
-        default_factory=lambda: [0.15, 0.35],
+        default_factory=_DEFAULT_SEND_CONFIRM_DELAY.copy,
         description="发送确认后延迟范围",
     )
     quote_intent_keywords: list[str] = Field(
-        default_factory=lambda: ["报价", "多少钱", "价格", "运费", "邮费", "快递费", "寄到", "发到", "送到", "怎么寄"],
+        default_factory=_DEFAULT_QUOTE_INTENT_KEYWORDS.copy,
         description="询价意图关键词",
     )
     standard_format_trigger_keywords: list[str] = Field(
-        default_factory=lambda: ["你好", "您好", "在吗", "在不", "hi", "hello", "哈喽", "有人吗"],
+        default_factory=_DEFAULT_STANDARD_FORMAT_TRIGGER_KEYWORDS.copy,
         description="触发标准询价格式模板的关键词（如招呼语）",
     )
     quote_missing_template: str = Field(
@@ -176,16 +228,8 @@ class MessagesConfig(BaseModel):
     quote: dict[str, Any] = Field(default_factory=dict, description="消息模块中的报价覆盖配置")
     workflow: dict[str, Any] = Field(default_factory=dict, description="常驻 workflow worker 配置")
 
-    @field_validator("transport")
-    @classmethod
-    def validate_transport(cls, v: str) -> str:
-        mode = str(v or "dom").strip().lower()
-        if mode not in {"dom", "ws", "auto"}:
-            raise ValueError("messages.transport must be one of dom|ws|auto")
-        return mode
-
 
-class QuoteConfig(BaseModel):
+class QuoteConfig(_ConfigBase):
     """自动报价配置模型"""
 
     enabled: bool = Field(default=True, description="是否启用自动报价")
@@ -209,36 +253,19 @@ class QuoteConfig(BaseModel):
     providers: dict[str, Any] = Field(default_factory=dict, description="报价 provider 配置")
 
 
-class AppConfig(BaseModel):
+class AppConfig(_ConfigBase):
     """应用配置模型"""
 
     name: str = Field(default="xianyu-openclaw", description="应用名称")
     version: str = Field(default="1.0.0", description="版本号")
     debug: bool = Field(default=False, description="调试模式")
-    log_level: str = Field(default="INFO", description="日志级别")
+    log_level: Annotated[str, _LOG_LEVEL_CHOICE] = Field(default="INFO", description="日志级别")
     data_dir: str = Field(default="data", description="数据目录")
     logs_dir: str = Field(default="logs", description="日志目录")
-    runtime: str = Field(default="auto", description="浏览器运行时：auto|lite|pro")
+    runtime: Annotated[str, _RUNTIME_CHOICE] = Field(default="auto", description="浏览器运行时：auto|lite|pro")
 
-    @field_validator("log_level")
-    @classmethod
-    def validate_log_level(cls, v: str) -> str:
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v not in valid_levels:
-            raise ValueError(f"log_level must be one of {valid_levels}, got {v}")
-        return v
 
-    @field_validator("runtime")
-    @classmethod
-    def validate_runtime(cls, v: str) -> str:
-        valid_runtimes = {"auto", "lite", "pro"}
-        runtime = str(v).lower().strip()
-        if runtime not in valid_runtimes:
-            raise ValueError(f"runtime must be one of {sorted(valid_runtimes)}, got {v}")
-        return runtime
-
-
-class ConfigModel(BaseModel):
+class ConfigModel(_ConfigBase):
     """完整配置模型"""
 
     app: AppConfig = Field(default_factory=AppConfig)
@@ -254,11 +281,6 @@ class ConfigModel(BaseModel):
     messages: MessagesConfig = Field(default_factory=MessagesConfig)
     quote: QuoteConfig = Field(default_factory=QuoteConfig)
 
-    @field_validator("default_account")
-    @classmethod
-    def validate_default_account(cls, v: str | None) -> str | None:
-        return v
-
     @property
     def openclaw(self) -> BrowserRuntimeConfig:
         """兼容旧字段名。"""
@@ -273,7 +295,12 @@ class ConfigModel(BaseModel):
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ConfigModel:
         """从字典创建配置"""
-        normalized = dict(data)
-        if "browser_runtime" not in normalized and "openclaw" in normalized:
-            normalized["browser_runtime"] = normalized["openclaw"]
-        return cls(**normalized)
+        if "browser_runtime" not in data and "openclaw" in data:
+            data = {**data, "browser_runtime": data["openclaw"]}
+        return _adapter_for(cls).validate_python(data)
+
+
+@lru_cache(maxsize=8)
+def _adapter_for(model: type[_ModelT]) -> TypeAdapter[_ModelT]:
+    """按模型类构建并缓存 TypeAdapter（含子类），之后每次重新加载直接复用。"""
+    return TypeAdapter(model)
@@ -7,8 +7,13 @@ Cookie Health Monitor
 
 from __future__ import annotations
 
+import atexit
 import os
+import re
+import threading
 import time
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 import httpx
@@ -20,13 +25,48 @@ logger = get_logger()
 # 闲鱼个人主页，需要登录态才能正常访问（未登录会 302 到登录页）
 _PROBE_URL = "https://www.goofish.com/im"
 _LOGIN_URL_FRAGMENT = "login"
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+# 200 响应但正文其实是登录页（前端跳转），只扫描开头一小段即可识别。
+# 正常页面也可能引用 passport 域名的脚本，因此只匹配跳转到登录域名的语句或登录页独有的 mini_login 资源
+_LOGIN_BODY_PATTERN = re.compile(
+    rb"(?:location(?:\.href)?\s*=\s*|location\.replace\(\s*|http-equiv=[\"']?refresh[\"']?[^>]*url=)"
+    rb"[\"']?https?://(?:passport\.goofish\.com|login\.taobao\.com)"
+    rb"|mini_login",
+    re.IGNORECASE,
+)
+_LOGIN_BODY_SCAN_BYTES = 2048
+_PROBE_HEADERS = {"User-Agent": "Mozilla/5.0"}
+_PROBE_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+# 进程内共享的同步探测客户端：Dashboard/CLI 每次检查都会新建 CookieHealthChecker，
+# 共享连接池后多个实例（多账号）之间也能复用 keep-alive 连接。超时按请求传入。
+_SHARED_CLIENT: httpx.Client | None = None
+_SHARED_CLIENT_LOCK = threading.Lock()
+
+
+def _get_shared_client() -> httpx.Client:
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None:
+        with _SHARED_CLIENT_LOCK:
+            if _SHARED_CLIENT is None:
+                _SHARED_CLIENT = httpx.Client(follow_redirects=False, headers=_PROBE_HEADERS, limits=_PROBE_LIMITS)
+                atexit.register(_close_shared_client)
+    return _SHARED_CLIENT
+
+
+def _close_shared_client() -> None:
+    global _SHARED_CLIENT
+    with _SHARED_CLIENT_LOCK:
+        client, _SHARED_CLIENT = _SHARED_CLIENT, None
+    if client is not None:
+        client.close()
 
 
 class CookieHealthChecker:
     """Cookie 有效性探测 + 飞书告警。
 
     通过请求闲鱼个人页判断 Cookie 是否有效：
-    - HTTP 200 且未跳转到登录页 → 有效
+    - HTTP 200 且未跳转到登录页、正文不是登录页 → 有效
     - HTTP 302 / 跳转到登录页 / 请求失败 → 无效
 
     集成飞书告警：Cookie 失效时即时通知，恢复后发送恢复消息。
@@ -51,7 +91,10 @@ class CookieHealthChecker:
         self._last_check_ts: float = 0.0
         self._last_healthy: bool | None = None
         self._last_alert_ts: float = 0.0
-        self._cached_result: dict[str, Any] | None = None
+        self._cached_result: Mapping[str, Any] | None = None
+
+        # 异步客户端绑定首次使用它的事件循环，因此按实例创建而不跨实例共享
+        self._aclient: httpx.AsyncClient | None = None
 
     @property
     def cookie_text(self) -> str:
@@ -64,20 +107,36 @@ class CookieHealthChecker:
         self._last_check_ts = 0.0
         self._cached_result = None
 
+    def _get_async_client(self) -> httpx.AsyncClient:
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                timeout=self._timeout,
+                follow_redirects=False,
+                headers=_PROBE_HEADERS,
+                limits=_PROBE_LIMITS,
+            )
+        return self._aclient
+
+    async def aclose(self) -> None:
+        """关闭异步探测客户端（同步客户端为进程共享，退出时统一关闭）。"""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
     def _needs_check(self) -> bool:
         """是否到了需要再次检查的时间。"""
         if not self._cookie_text:
             return True
         return (time.time() - self._last_check_ts) >= self._check_interval
 
-    def check_sync(self, force: bool = False) -> dict[str, Any]:
+    def check_sync(self, force: bool = False) -> Mapping[str, Any]:
         """同步检查 Cookie 健康状态。
 
         Args:
             force: 强制检查，忽略 TTL 缓存。
 
         Returns:
-            包含 healthy, message, checked_at 等字段的字典。
+            包含 healthy, message, checked_at 等字段的只读映射。
         """
         if not force and not self._needs_check() and self._cached_result is not None:
             return self._cached_result
@@ -87,14 +146,14 @@ class CookieHealthChecker:
         self._cached_result = result
         return result
 
-    async def check_async(self, force: bool = False) -> dict[str, Any]:
+    async def check_async(self, force: bool = False) -> Mapping[str, Any]:
         """异步检查 Cookie 健康状态。
 
         Args:
             force: 强制检查，忽略 TTL 缓存。
 
         Returns:
-            包含 healthy, message, checked_at 等字段的字典。
+            包含 healthy, message, checked_at 等字段的只读映射。
         """
         if not force and not self._needs_check() and self._cached_result is not None:
             return self._cached_result
@@ -108,72 +167,69 @@ class CookieHealthChecker:
 
         return result
 
-    def _do_check_sync(self) -> dict[str, Any]:
+    def _do_check_sync(self) -> Mapping[str, Any]:
         """同步 HTTP 探测。"""
         if not self._cookie_text:
             return self._build_result(False, "Cookie 未配置")
 
         try:
-            with httpx.Client(
-                timeout=self._timeout,
-                follow_redirects=False,
-                headers={"Cookie": self._cookie_text, "User-Agent": "Mozilla/5.0"},
-            ) as client:
-                resp = client.get(_PROBE_URL)
-                return self._evaluate_response(resp)
+            resp = _get_shared_client().get(_PROBE_URL, headers={"Cookie": self._cookie_text}, timeout=self._timeout)
+            return self._evaluate_response(resp)
         except httpx.TimeoutException:
             return self._build_result(False, "探测超时")
         except Exception as exc:
             return self._build_result(False, f"探测异常: {type(exc).__name__}")
 
-    async def _do_check_async(self) -> dict[str, Any]:
+    async def _do_check_async(self) -> Mapping[str, Any]:
         """异步 HTTP 探测。"""
         if not self._cookie_text:
             return self._build_result(False, "Cookie 未配置")
 
         try:
-            async with httpx.AsyncClient(
-                timeout=self._timeout,
-                follow_redirects=False,
-                headers={"Cookie": self._cookie_text, "User-Agent": "Mozilla/5.0"},
-            ) as client:
-                resp = await client.get(_PROBE_URL)
-                return self._evaluate_response(resp)
+            resp = await self._get_async_client().get(_PROBE_URL, headers={"Cookie": self._cookie_text})
+            return self._evaluate_response(resp)
         except httpx.TimeoutException:
             return self._build_result(False, "探测超时")
         except Exception as exc:
             return self._build_result(False, f"探测异常: {type(exc).__name__}")
 
-    def _evaluate_response(self, resp: httpx.Response) -> dict[str, Any]:
+    def _evaluate_response(self, resp: httpx.Response) -> Mapping[str, Any]:
         """根据 HTTP 响应判断 Cookie 是否有效。"""
-        if resp.status_code in {301, 302, 303, 307, 308}:
+        status = resp.status_code
+        # 健康路径优先返回，不读取也不转换 Location 头
+        if status == 200:
+            if _LOGIN_BODY_PATTERN.search(resp.content[:_LOGIN_BODY_SCAN_BYTES]):
+                return self._build_result(False, "Cookie 已过期（返回登录页）")
+            return self._build_result(True, "Cookie 有效")
+
+        if status in _REDIRECT_STATUSES:
             location = resp.headers.get("location", "")
-            if _LOGIN_URL_FRAGMENT in location.lower():
+            if _LOGIN_URL_FRAGMENT in location.casefold():
                 return self._build_result(False, "Cookie 已过期（被重定向到登录页）")
             return self._build_result(False, f"非预期跳转: {location[:80]}")
 
-        if resp.status_code == 200:
-            return self._build_result(True, "Cookie 有效")
-
-        if resp.status_code in {403, 401}:
+        if status in {403, 401}:
             return self._build_result(False, "Cookie 已过期或无效")
 
         # 404 等非致命状态码 — 闲鱼页面结构可能变化，
         # 只要服务器有响应且不是认证失败，Cookie 可能仍有效
-        if resp.status_code == 404:
+        if status == 404:
             return self._build_result(True, "页面返回 404 但连接正常")
 
-        return self._build_result(False, f"HTTP {resp.status_code}")
+        return self._build_result(False, f"HTTP {status}")
 
-    def _build_result(self, healthy: bool, message: str) -> dict[str, Any]:
-        return {
-            "healthy": healthy,
-            "message": message,
-            "checked_at": time.time(),
-            "previous_healthy": self._last_healthy,
-        }
+    def _build_result(self, healthy: bool, message: str) -> Mapping[str, Any]:
+        # 只读视图：缓存结果可安全地按引用返回给多个调用方
+        return MappingProxyType(
+            {
+                "healthy": healthy,
+                "message": message,
+                "checked_at": time.time(),
+                "previous_healthy": self._last_healthy,
+            }
+        )
 
-    async def _handle_state_change(self, result: dict[str, Any]) -> None:
+    async def _handle_state_change(self, result: Mapping[str, Any]) -> None:
         """状态变化时触发飞书告警或恢复通知。"""
         healthy = result["healthy"]
         prev = self._last_healthy
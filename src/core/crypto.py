@@ -9,14 +9,29 @@ Sensitive Data Encryption
 import base64
 import hashlib
 import os
+import threading
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 from src.core.logger import get_logger
 
+try:
+    from cryptography.fernet import Fernet
+
+    _HAS_CRYPTO = True
+except ImportError:  # pragma: no cover - 依赖缺失时降级为明文
+    Fernet = None
+    _HAS_CRYPTO = False
+
 logger = get_logger()
 
 _KEY_ENV = "ENCRYPTION_KEY"
 _KEY_FILE = "data/.encryption_key"
+_FERNET_PREFIX = "gAAAAA"
+
+_fernet: tuple[bytes, Any] | None = None
+_fernet_lock = threading.Lock()
 
 
 def _derive_key(passphrase: str) -> bytes:
@@ -26,8 +41,13 @@ def _derive_key(passphrase: str) -> bytes:
 
 
 def _get_or_create_key() -> bytes:
-    """获取或创建加密密钥"""
-    env_key = os.getenv(_KEY_ENV)
+    """获取或创建加密密钥；每次按当前 ENCRYPTION_KEY 取值解析，.env 晚于首次调用加载时也能切换到正确密钥"""
+    return _resolve_key(os.getenv(_KEY_ENV) or None)
+
+
+@lru_cache(maxsize=4)
+def _resolve_key(env_key: str | None) -> bytes:
+    """按 ENCRYPTION_KEY 取值缓存密钥；未设置时读取或生成密钥文件"""
     if env_key:
         return _derive_key(env_key)
 
@@ -48,11 +68,9 @@ def _get_or_create_key() -> bytes:
             logger.debug(f"Could not check key file permissions: {e}")
         return key_path.read_bytes().strip()
 
-    try:
-        from cryptography.fernet import Fernet
-
+    if _HAS_CRYPTO:
         key = Fernet.generate_key()
-    except ImportError:
+    else:
         key = base64.urlsafe_b64encode(os.urandom(32))
 
     key_path.parent.mkdir(parents=True, exist_ok=True)
@@ -71,35 +89,49 @@ def _get_or_create_key() -> bytes:
     return key
 
 
+def _get_fernet() -> Any:
+    """返回当前密钥对应的 Fernet 实例，密钥变化时重建"""
+    global _fernet
+    key = _get_or_create_key()
+    cached = _fernet
+    if cached is None or cached[0] != key:
+        with _fernet_lock:
+            cached = _fernet
+            if cached is None or cached[0] != key:
+                cached = _fernet = (key, Fernet(key))
+    return cached[1]
+
+
+def _reset_key_cache() -> None:
+    """清除密钥与 Fernet 缓存（密钥变更或测试时使用）"""
+    global _fernet
+    with _fernet_lock:
+        _fernet = None
+    _resolve_key.cache_clear()
+
+
 def encrypt_value(plaintext: str) -> str:
     """加密字符串，返回 base64 编码的密文"""
-    try:
-        from cryptography.fernet import Fernet
-
-        f = Fernet(_get_or_create_key())
-        return f.encrypt(plaintext.encode("utf-8")).decode("utf-8")
-    except ImportError:
+    if not _HAS_CRYPTO:
         logger.warning("cryptography 未安装，Cookie 将以明文存储。建议执行: pip install cryptography")
         return plaintext
+    return _get_fernet().encrypt(plaintext.encode("utf-8")).decode("utf-8")
 
 
 def decrypt_value(ciphertext: str) -> str:
     """解密 base64 编码的密文，返回明文"""
-    try:
-        from cryptography.fernet import Fernet
-
-        f = Fernet(_get_or_create_key())
-        return f.decrypt(ciphertext.encode("utf-8")).decode("utf-8")
-    except ImportError:
+    if not _HAS_CRYPTO:
         logger.warning("cryptography 未安装，Cookie 将以明文存储。建议执行: pip install cryptography")
         return ciphertext
+    try:
+        return _get_fernet().decrypt(ciphertext.encode("utf-8")).decode("utf-8")
     except Exception:
         return ciphertext
 
 
 def is_encrypted(value: str) -> bool:
     """检查值是否已加密（Fernet 密文以 gAAAAA 开头）"""
-    return value.startswith("gAAAAA")
+    return value[:6] == _FERNET_PREFIX
 
 
 def ensure_encrypted(value: str) -> str:
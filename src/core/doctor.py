@@ -2,35 +2,57 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
 import socket
-import urllib.error
-import urllib.request
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+import httpx
+
 from src.core.config import get_config
 from src.core.startup_checks import resolve_runtime_mode, run_all_checks
-from src.modules.quote import CostTableRepository
-
-_SUGGESTIONS = {
-    "浏览器运行时": "可通过 `.env` 设置 `APP_RUNTIME=auto|lite|pro`，推荐先用 `auto`。",
-    "Python版本": "请安装 Python 3.10+，并使用 `python3 -m venv .venv` 创建虚拟环境。",
-    "Legacy Browser Gateway": "如需启用 legacy browser gateway，请先执行 `docker compose up -d`，再重试 doctor。",
-    "Lite 浏览器驱动": "请执行 `pip install playwright`，然后执行 `playwright install chromium`。",
-    "数据库": "请确认数据库目录可写，并检查 `config/config.yaml` 中 database.path 配置。",
-    "闲鱼Cookie": "请在 `.env` 中设置有效的 `XIANYU_COOKIE_1`。",
-    "Cookie有效性": "请重新抓取并更新闲鱼 Cookie，避免使用过期会话。",
-    "Cookie在线有效性": "Cookie 已过期，请重新从浏览器获取并更新 `.env` 中的 `XIANYU_COOKIE_1`。",
-    "AI服务": "可配置 `DEEPSEEK_API_KEY` 或 `OPENAI_API_KEY`，未配置将退化到模板模式。",
-    ".env 文件": "请复制 `.env.example` 为 `.env`，并补齐关键配置。",
-    "配置文件": "请确保 `config/config.yaml` 存在，或从 `config/config.example.yaml` 复制生成。",
-    "Dashboard守护状态": "请使用 `python3 -m src.dashboard_server --port 8091` 或对应 bat 脚本启动面板服务。",
-    "消息首响SLA": "建议开启 `messages.fast_reply_enabled=true` 且 `reply_target_seconds<=3`。",
-    "自动报价成本源": "请提供成本表（data/quote_costs）或配置 `quote.cost_api_url`。",
-    "报价Mock门禁": "请在配置中设置 `quote.providers.remote.allow_mock=false`，并确认生产环境未通过环境变量覆盖为 true。",
-}
+
+_SUGGESTIONS = MappingProxyType(
+    {
+        "浏览器运行时": "可通过 `.env` 设置 `APP_RUNTIME=auto|lite|pro`，推荐先用 `auto`。",
+        "Python版本": "请安装 Python 3.10+，并使用 `python3 -m venv .venv` 创建虚拟环境。",
+        "Legacy Browser Gateway": "如需启用 legacy browser gateway，请先执行 `docker compose up -d`，再重试 doctor。",
+        "Lite 浏览器驱动": "请执行 `pip install playwright`，然后执行 `playwright install chromium`。",
+        "数据库": "请确认数据库目录可写，并检查 `config/config.yaml` 中 database.path 配置。",
+        "闲鱼Cookie": "请在 `.env` 中设置有效的 `XIANYU_COOKIE_1`。",
+        "Cookie有效性": "请重新抓取并更新闲鱼 Cookie，避免使用过期会话。",
+        "Cookie在线有效性": "Cookie 已过期，请重新从浏览器获取并更新 `.env` 中的 `XIANYU_COOKIE_1`。",
+        "AI服务": "可配置 `DEEPSEEK_API_KEY` 或 `OPENAI_API_KEY`，未配置将退化到模板模式。",
+        ".env 文件": "请复制 `.env.example` 为 `.env`，并补齐关键配置。",
+        "配置文件": "请确保 `config/config.yaml` 存在，或从 `config/config.example.yaml` 复制生成。",
+        "Dashboard守护状态": "请使用 `python3 -m src.dashboard_server --port 8091` 或对应 bat 脚本启动面板服务。",
+        "消息首响SLA": "建议开启 `messages.fast_reply_enabled=true` 且 `reply_target_seconds<=3`。",
+        "自动报价成本源": "请提供成本表（data/quote_costs）或配置 `quote.cost_api_url`。",
+        "报价Mock门禁": (
+            "请在配置中设置 `quote.providers.remote.allow_mock=false`，并确认生产环境未通过环境变量覆盖为 true。"
+        ),
+    }
+)
+
+
+_HTTP_CLIENT: httpx.Client | None = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """返回进程内复用的 HTTP 客户端，首次使用时创建并在退出时关闭。"""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        with _HTTP_CLIENT_LOCK:
+            if _HTTP_CLIENT is None:
+                _HTTP_CLIENT = httpx.Client(timeout=8.0)
+                atexit.register(_HTTP_CLIENT.close)
+    return _HTTP_CLIENT
 
 
 def _check_port_open(port: int, host: str = "127.0.0.1", timeout: float = 0.3) -> bool:
@@ -44,6 +66,15 @@ def _check_port_open(port: int, host: str = "127.0.0.1", timeout: float = 0.3) -
         return False
 
 
+def _check_ports_bulk(ports: list[int]) -> dict[int, bool]:
+    """并发探测多个端口，总耗时取决于最慢的一次探测而非逐个累加。"""
+    unique = list(dict.fromkeys(ports))
+    if len(unique) <= 1:
+        return {port: _check_port_open(port) for port in unique}
+    with ThreadPoolExecutor(max_workers=len(unique)) as pool:
+        return dict(zip(unique, pool.map(_check_port_open, unique), strict=True))
+
+
 def _append_check(
     checks: list[dict[str, Any]],
     *,
@@ -70,9 +101,21 @@ def _append_check(
     )
 
 
-def _extra_checks(skip_quote: bool = False) -> list[dict[str, Any]]:
+def _load_config() -> tuple[Any, Exception | None]:
+    try:
+        return get_config(), None
+    except Exception as exc:
+        return None, exc
+
+
+def _extra_checks(
+    skip_quote: bool = False,
+    runtime: str | None = None,
+    config_state: tuple[Any, Exception | None] | None = None,
+) -> list[dict[str, Any]]:
     checks: list[dict[str, Any]] = []
-    runtime = resolve_runtime_mode()
+    if runtime is None:
+        runtime = resolve_runtime_mode()
 
     env_exists = Path(".env").exists()
     _append_check(
@@ -94,6 +137,10 @@ def _extra_checks(skip_quote: bool = False) -> list[dict[str, Any]]:
     )
 
     web_port = int(os.getenv("FRONTEND_PORT") or os.getenv("OPENCLAW_WEB_PORT", "5173"))
+    dashboard_port = int(os.getenv("DASHBOARD_PORT", "8091"))
+    probe_ports = [dashboard_port] if runtime == "lite" else [web_port, dashboard_port]
+    port_status = _check_ports_bulk(probe_ports)
+
     if runtime == "lite":
         _append_check(
             checks,
@@ -104,7 +151,7 @@ def _extra_checks(skip_quote: bool = False) -> list[dict[str, Any]]:
             meta={"port": web_port, "skipped": True, "runtime": runtime},
         )
     else:
-        web_listening = _check_port_open(web_port)
+        web_listening = port_status[web_port]
         _append_check(
             checks,
             name="Web UI 端口",
@@ -115,8 +162,7 @@ def _extra_checks(skip_quote: bool = False) -> list[dict[str, Any]]:
             meta={"port": web_port},
         )
 
-    dashboard_port = int(os.getenv("DASHBOARD_PORT", "8091"))
-    dashboard_listening = _check_port_open(dashboard_port)
+    dashboard_listening = port_status[dashboard_port]
     _append_check(
         checks,
         name="Dashboard 端口",
@@ -135,16 +181,16 @@ def _extra_checks(skip_quote: bool = False) -> list[dict[str, Any]]:
     dashboard_api_msg = "Dashboard API 未检测"
     if dashboard_listening:
         try:
-            with urllib.request.urlopen(f"http://127.0.0.1:{dashboard_port}/api/status", timeout=8.0) as resp:
-                raw = resp.read().decode("utf-8", errors="ignore")
-                payload = json.loads(raw)
-                if isinstance(payload, dict) and "service_status" in payload:
-                    dashboard_api_ok = True
-                    dashboard_api_msg = "Dashboard API 正常"
-                else:
-                    dashboard_api_msg = "Dashboard API 响应缺少 service_status"
-        except urllib.error.URLError as exc:
-            dashboard_api_msg = f"Dashboard API 不可用: {exc.reason}"
+            resp = _get_http_client().get(f"http://127.0.0.1:{dashboard_port}/api/status")
+            resp.raise_for_status()
+            payload = json.loads(resp.content)
+            if isinstance(payload, dict) and "service_status" in payload:
+                dashboard_api_ok = True
+                dashboard_api_msg = "Dashboard API 正常"
+            else:
+                dashboard_api_msg = "Dashboard API 响应缺少 service_status"
+        except httpx.HTTPError as exc:
+            dashboard_api_msg = f"Dashboard API 不可用: {exc}"
         except Exception as exc:
             dashboard_api_msg = f"Dashboard API 检查失败: {exc}"
     else:
@@ -159,35 +205,46 @@ def _extra_checks(skip_quote: bool = False) -> list[dict[str, Any]]:
         meta={"port": dashboard_port, "port_listening": dashboard_listening},
     )
 
-    try:
-        config = get_config()
-        messages_cfg = config.get_section("messages", {})
-        fast_reply_enabled = bool(messages_cfg.get("fast_reply_enabled", False))
-        reply_target_seconds = float(messages_cfg.get("reply_target_seconds", 3.0))
-        sla_ok = fast_reply_enabled and reply_target_seconds <= 3.0
-        _append_check(
-            checks,
-            name="消息首响SLA",
-            passed=sla_ok,
-            message=(
-                f"已启用快速首响，目标 {reply_target_seconds:.2f}s"
-                if sla_ok
-                else f"未满足首响目标：fast_reply_enabled={fast_reply_enabled}, target={reply_target_seconds:.2f}s"
-            ),
-            critical=False,
-            meta={
-                "fast_reply_enabled": fast_reply_enabled,
-                "reply_target_seconds": reply_target_seconds,
-            },
-        )
-    except Exception as exc:
+    # 配置只取一次，消息与报价两项检查共用；加载失败时两项直接记为失败
+    config, config_error = config_state if config_state is not None else _load_config()
+
+    if config_error is not None:
         _append_check(
             checks,
             name="消息首响SLA",
             passed=False,
-            message=f"检查失败: {exc}",
+            message=f"检查失败: {config_error}",
             critical=False,
         )
+    else:
+        try:
+            messages_cfg = config.get_section("messages", {})
+            fast_reply_enabled = bool(messages_cfg.get("fast_reply_enabled", False))
+            reply_target_seconds = float(messages_cfg.get("reply_target_seconds", 3.0))
+            sla_ok = fast_reply_enabled and reply_target_seconds <= 3.0
+            _append_check(
+                checks,
+                name="消息首响SLA",
+                passed=sla_ok,
+                message=(
+                    f"已启用快速首响，目标 {reply_target_seconds:.2f}s"
+                    if sla_ok
+                    else f"未满足首响目标：fast_reply_enabled={fast_reply_enabled}, target={reply_target_seconds:.2f}s"
+                ),
+                critical=False,
+                meta={
+                    "fast_reply_enabled": fast_reply_enabled,
+                    "reply_target_seconds": reply_target_seconds,
+                },
+            )
+        except Exception as exc:
+            _append_check(
+                checks,
+                name="消息首响SLA",
+                passed=False,
+                message=f"检查失败: {exc}",
+                critical=False,
+            )
 
     if skip_quote:
         return checks
@@ -206,7 +263,7 @@ def _extra_checks(skip_quote: bool = False) -> list[dict[str, Any]]:
                 passed=bool(result.get("healthy", False)),
                 message=str(result.get("message", "未知")),
                 critical=False,
-                meta=result,
+                meta=dict(result),
             )
         except Exception as exc:
             _append_check(
@@ -217,10 +274,22 @@ def _extra_checks(skip_quote: bool = False) -> list[dict[str, Any]]:
                 critical=False,
             )
 
+    if config_error is not None:
+        _append_check(
+            checks,
+            name="自动报价成本源",
+            passed=False,
+            message=f"检查失败: {config_error}",
+            critical=False,
+        )
+        return checks
+
     try:
-        config = get_config()
         quote_cfg = config.get_section("quote", {})
         mode = str(quote_cfg.get("mode", "rule_only")).strip().lower()
+        # 按需导入：src.modules 包会连带加载全部服务（含 openai SDK），--skip-quote 时无需付出该开销
+        from src.modules.quote.cost_table import CostTableRepository
+
         repo = CostTableRepository(
             table_dir=quote_cfg.get("cost_table_dir", "data/quote_costs"),
             include_patterns=quote_cfg.get("cost_table_patterns", ["*.xlsx", "*.csv"]),
@@ -264,7 +333,17 @@ def _extra_checks(skip_quote: bool = False) -> list[dict[str, Any]]:
 def run_doctor(skip_gateway: bool = False, skip_quote: bool = False) -> dict[str, Any]:
     checks: list[dict[str, Any]] = []
 
-    startup_checks = run_all_checks(skip_browser=bool(skip_gateway))
+    # 启动检查（含最长 5s 的 gateway 探测）与端口/Dashboard/Cookie 等额外检查互不依赖，
+    # 并发执行后按原顺序汇总，总耗时取两者较慢者。
+    # 运行时与配置须在提交前于当前线程解析：首次解析会 load_dotenv 写 os.environ 并创建配置单例，
+    # 放到两个线程里各自触发会产生竞争
+    runtime = resolve_runtime_mode()
+    config_state = _load_config()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        startup_future = pool.submit(run_all_checks, skip_browser=bool(skip_gateway), runtime=runtime)
+        extra_checks = _extra_checks(skip_quote=skip_quote, runtime=runtime, config_state=config_state)
+        startup_checks = startup_future.result()
+
     for item in startup_checks:
         _append_check(
             checks,
@@ -274,30 +353,33 @@ def run_doctor(skip_gateway: bool = False, skip_quote: bool = False) -> dict[str
             critical=item.critical,
         )
 
-    checks.extend(_extra_checks(skip_quote=skip_quote))
+    checks.extend(extra_checks)
 
-    total = len(checks)
-    passed_count = sum(1 for c in checks if c["passed"])
-    failed = [c for c in checks if not c["passed"]]
-    critical_failed = [c for c in failed if c["critical"]]
-    warning_failed = [c for c in failed if not c["critical"]]
-
-    next_steps: list[str] = []
-    seen: set[str] = set()
-    for item in failed:
+    # 单次遍历完成汇总与建议去重，dict 保留建议首次出现的顺序
+    failed = 0
+    critical_failed = 0
+    suggestions: dict[str, None] = {}
+    for item in checks:
+        if item["passed"]:
+            continue
+        failed += 1
+        if item["critical"]:
+            critical_failed += 1
         suggestion = str(item.get("suggestion", "")).strip()
-        if suggestion and suggestion not in seen:
-            seen.add(suggestion)
-            next_steps.append(suggestion)
+        if suggestion:
+            suggestions[suggestion] = None
+
+    total = len(checks)
+    next_steps = list(suggestions)
 
     return {
-        "ready": len(critical_failed) == 0,
+        "ready": critical_failed == 0,
         "summary": {
             "total": total,
-            "passed": passed_count,
-            "failed": len(failed),
-            "critical_failed": len(critical_failed),
-            "warning_failed": len(warning_failed),
+            "passed": total - failed,
+            "failed": failed,
+            "critical_failed": critical_failed,
+            "warning_failed": failed - critical_failed,
         },
         "checks": checks,
         "next_steps": next_steps,
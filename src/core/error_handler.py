@@ -9,6 +9,8 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import random
+import time
 from collections.abc import Callable
 from functools import wraps
 from typing import Any
@@ -17,6 +19,63 @@ import httpx
 
 from src.core.logger import get_logger
 
+_NETWORK_ERRORS = (ConnectionError, httpx.ConnectError, httpx.NetworkError)
+
+# handle_controller_errors 的日志规则，按顺序匹配第一项（子类须排在父类 httpx.HTTPError 之前）
+_CONTROLLER_ERROR_LOGS: tuple[tuple[type[BaseException] | tuple[type[BaseException], ...], str, str], ...] = (
+    (_NETWORK_ERRORS, "warning", "Network connection error in {name}: {e}"),
+    (httpx.TimeoutException, "warning", "Timeout in {name}: {e}"),
+    (httpx.HTTPStatusError, "error", "HTTP error in {name}: {e.response.status_code}"),
+    (httpx.HTTPError, "error", "HTTP request error in {name}: {e}"),
+)
+
+
+def _guard(
+    func: Callable,
+    *,
+    exceptions: tuple[type[BaseException], ...],
+    on_error: Callable[[tuple, BaseException], None],
+    default_return: Any,
+    raise_on_error: bool,
+) -> Callable:
+    """
+    构建“捕获 → 记录 → 重抛或返回默认值”的包装器
+
+    在装饰时判定 func 是否为协程函数，只生成需要的那一个包装器。
+
+    Args:
+        func: 被装饰的函数
+        exceptions: 需要捕获的异常类型
+        on_error: 记录异常的回调，参数为调用位置参数与异常
+        default_return: 发生异常时返回的默认值
+        raise_on_error: 是否在异常时重新抛出
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except exceptions as e:
+                on_error(args, e)
+                if raise_on_error:
+                    raise
+                return default_return
+
+        return async_wrapper
+
+    @wraps(func)
+    def sync_wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except exceptions as e:
+            on_error(args, e)
+            if raise_on_error:
+                raise
+            return default_return
+
+    return sync_wrapper
+
 
 def handle_controller_errors(default_return: Any = None, raise_on_error: bool = False):
     """
@@ -32,31 +91,16 @@ def handle_controller_errors(default_return: Any = None, raise_on_error: bool =
         async def async_wrapper(self, *args, **kwargs):
             try:
                 return await func(self, *args, **kwargs)
-            except (ConnectionError, httpx.ConnectError, httpx.NetworkError) as e:
-                self.logger.warning(f"Network connection error in {func.__name__}: {e}")
-                if raise_on_error:
-                    raise
-                return default_return
-            except httpx.TimeoutException as e:
-                self.logger.warning(f"Timeout in {func.__name__}: {e}")
-                if raise_on_error:
-                    raise
-                return default_return
-            except httpx.HTTPStatusError as e:
-                self.logger.error(f"HTTP error in {func.__name__}: {e.response.status_code}")
-                if raise_on_error:
-                    raise
-                return default_return
-            except httpx.HTTPError as e:
-                self.logger.error(f"HTTP request error in {func.__name__}: {e}")
-                if raise_on_error:
-                    raise
-                return default_return
             except asyncio.CancelledError:
                 self.logger.debug(f"Task cancelled in {func.__name__}")
                 raise
             except Exception as e:
-                self.logger.error(f"Unexpected error in {func.__name__}: {e}", exc_info=True)
+                for exc_types, level, template in _CONTROLLER_ERROR_LOGS:
+                    if isinstance(e, exc_types):
+                        getattr(self.logger, level)(template.format(name=func.__name__, e=e))
+                        break
+                else:
+                    self.logger.error(f"Unexpected error in {func.__name__}: {e}", exc_info=True)
                 if raise_on_error:
                     raise
                 return default_return
@@ -76,37 +120,22 @@ def handle_operation_errors(default_return: Any = False, raise_on_error: bool =
     """
 
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        async def async_wrapper(self, *args, **kwargs):
-            try:
-                return await func(self, *args, **kwargs)
-            except (ConnectionError, httpx.ConnectError, httpx.NetworkError) as e:
-                self.logger.debug(f"Network error in {func.__name__}: {e}")
-                if raise_on_error:
-                    raise
-                return default_return
-            except httpx.TimeoutException:
-                self.logger.debug(f"Timeout in {func.__name__}")
-                if raise_on_error:
-                    raise
-                return default_return
-            except Exception as e:
-                self.logger.debug(f"Error in {func.__name__}: {e}")
-                if raise_on_error:
-                    raise
-                return default_return
-
-        @wraps(func)
-        def sync_wrapper(self, *args, **kwargs):
-            try:
-                return func(self, *args, **kwargs)
-            except Exception as e:
-                self.logger.debug(f"Error in {func.__name__}: {e}")
-                if raise_on_error:
-                    raise
-                return default_return
-
-        return async_wrapper if inspect.iscoroutinefunction(func) else sync_wrapper
+        def on_error(args: tuple, e: BaseException) -> None:
+            log = args[0].logger
+            if isinstance(e, _NETWORK_ERRORS):
+                log.debug(f"Network error in {func.__name__}: {e}")
+            elif isinstance(e, httpx.TimeoutException):
+                log.debug(f"Timeout in {func.__name__}")
+            else:
+                log.debug(f"Error in {func.__name__}: {e}")
+
+        return _guard(
+            func,
+            exceptions=(Exception,),
+            on_error=on_error,
+            default_return=default_return,
+            raise_on_error=raise_on_error,
+        )
 
     return decorator
 
@@ -116,38 +145,19 @@ def safe_execute(logger=None, default_return: Any = None, raise_on_error: bool =
     安全执行装饰器（用于可能失败的操作，静默失败）
 
     Args:
-        logger: 日志记录器，不指定则使用全局logger
+        logger: 日志记录器，不指定则在记录时取全局logger
         default_return: 发生异常时返回的默认值
         raise_on_error: 是否在异常时重新抛出
     """
-    if logger is None:
-        logger = get_logger()
 
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            try:
-                return await func(*args, **kwargs)
-            except Exception as e:
-                logger.debug(f"Error in {func.__name__}: {e}")
-                if raise_on_error:
-                    raise
-                return default_return
-
-        @wraps(func)
-        def sync_wrapper(*args, **kwargs):
-            try:
-                return func(*args, **kwargs)
-            except Exception as e:
-                logger.debug(f"Error in {func.__name__}: {e}")
-                if raise_on_error:
-                    raise
-                return default_return
-
-        if inspect.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return _guard(
+            func,
+            exceptions=(Exception,),
+            on_error=lambda _args, e: (logger or get_logger()).debug(f"Error in {func.__name__}: {e}"),
+            default_return=default_return,
+            raise_on_error=raise_on_error,
+        )
 
     return decorator
 
@@ -162,27 +172,34 @@ def retry(max_attempts: int = 3, delay: float = 1.0, backoff_factor: float = 2.0
         backoff_factor: 退避因子
         exceptions: 需要重试的异常类型
     """
+    # 退避序列在装饰时算好；每次等待另加至多 10% 的随机抖动，避免大量调用方同步重试
+    backoff_delays = tuple(delay * (backoff_factor**attempt) for attempt in range(max(max_attempts - 1, 0)))
 
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            logger = kwargs.pop("logger", None) or get_logger()
+        if inspect.iscoroutinefunction(func):
 
-            for attempt in range(max_attempts):
-                try:
-                    return await func(*args, **kwargs)
-                except KeyboardInterrupt:
-                    raise
-                except exceptions as e:
-                    if attempt == max_attempts - 1:
-                        logger.error(f"Final attempt failed for {func.__name__}: {e}")
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                logger = kwargs.pop("logger", None) or get_logger()
+
+                for attempt in range(max_attempts):
+                    try:
+                        return await func(*args, **kwargs)
+                    except KeyboardInterrupt:
                         raise
+                    except exceptions as e:
+                        if attempt == max_attempts - 1:
+                            logger.error(f"Final attempt failed for {func.__name__}: {e}")
+                            raise
+
+                        base_delay = backoff_delays[attempt]
+                        wait_time = base_delay + random.uniform(0, base_delay * 0.1)
+                        logger.warning(
+                            f"Attempt {attempt + 1} failed for {func.__name__}: {e}. Retrying in {wait_time:.1f}s..."
+                        )
+                        await asyncio.sleep(wait_time)
 
-                    wait_time = delay * (backoff_factor**attempt)
-                    logger.warning(
-                        f"Attempt {attempt + 1} failed for {func.__name__}: {e}. Retrying in {wait_time:.1f}s..."
-                    )
-                    await asyncio.sleep(wait_time)
+            return async_wrapper
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
@@ -198,15 +215,14 @@ def retry(max_attempts: int = 3, delay: float = 1.0, backoff_factor: float = 2.0
                         logger.error(f"Final attempt failed for {func.__name__}: {e}")
                         raise
 
-                    wait_time = delay * (backoff_factor**attempt)
+                    base_delay = backoff_delays[attempt]
+                    wait_time = base_delay + random.uniform(0, base_delay * 0.1)
                     logger.warning(
                         f"Attempt {attempt + 1} failed for {func.__name__}: {e}. Retrying in {wait_time:.1f}s..."
                     )
-                    import time
-
                     time.sleep(wait_time)
 
-        return async_wrapper if inspect.iscoroutinefunction(func) else sync_wrapper
+        return sync_wrapper
 
     return decorator
 
@@ -216,48 +232,43 @@ def log_execution_time(logger=None):
     记录执行时间装饰器
 
     Args:
-        logger: 日志记录器
+        logger: 日志记录器，不指定则在记录时取全局logger
     """
-    if logger is None:
-        logger = get_logger()
 
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            import time
+        if inspect.iscoroutinefunction(func):
 
-            start_time = time.time()
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start_ns = time.monotonic_ns()
 
-            try:
-                result = await func(*args, **kwargs)
-                elapsed = time.time() - start_time
-                logger.debug(f"{func.__name__} executed in {elapsed:.2f}s")
-                return result
-            except Exception as e:
-                elapsed = time.time() - start_time
-                logger.error(f"{func.__name__} failed after {elapsed:.2f}s: {e}", exc_info=True)
-                raise
+                try:
+                    result = await func(*args, **kwargs)
+                    elapsed = (time.monotonic_ns() - start_ns) / 1e9
+                    (logger or get_logger()).debug(f"{func.__name__} executed in {elapsed:.2f}s")
+                    return result
+                except Exception as e:
+                    elapsed = (time.monotonic_ns() - start_ns) / 1e9
+                    (logger or get_logger()).error(f"{func.__name__} failed after {elapsed:.2f}s: {e}", exc_info=True)
+                    raise
+
+            return async_wrapper
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
-            import time
-
-            start_time = time.time()
+            start_ns = time.monotonic_ns()
 
             try:
                 result = func(*args, **kwargs)
-                elapsed = time.time() - start_time
-                logger.debug(f"{func.__name__} executed in {elapsed:.2f}s")
+                elapsed = (time.monotonic_ns() - start_ns) / 1e9
+                (logger or get_logger()).debug(f"{func.__name__} executed in {elapsed:.2f}s")
                 return result
             except Exception as e:
-                elapsed = time.time() - start_time
-                logger.error(f"{func.__name__} failed after {elapsed:.2f}s: {e}", exc_info=True)
+                elapsed = (time.monotonic_ns() - start_ns) / 1e9
+                (logger or get_logger()).error(f"{func.__name__} failed after {elapsed:.2f}s: {e}", exc_info=True)
                 raise
 
-        if inspect.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return sync_wrapper
 
     return decorator
 
@@ -320,39 +331,19 @@ def handle_errors(
     Args:
         exceptions: 需要捕获的异常类型
         default_return: 默认返回值
-        logger: 日志记录器
+        logger: 日志记录器，不指定则在记录时取全局logger
         raise_on_error: 是否重新抛出异常
     """
     if exceptions is None:
         exceptions = (Exception,)
 
-    if logger is None:
-        logger = get_logger()
-
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            try:
-                return await func(*args, **kwargs)
-            except exceptions as e:
-                logger.error(f"Error in {func.__name__}: {e}", exc_info=True)
-                if raise_on_error:
-                    raise
-                return default_return
-
-        @wraps(func)
-        def sync_wrapper(*args, **kwargs):
-            try:
-                return func(*args, **kwargs)
-            except exceptions as e:
-                logger.error(f"Error in {func.__name__}: {e}", exc_info=True)
-                if raise_on_error:
-                    raise
-                return default_return
-
-        if inspect.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return _guard(
+            func,
+            exceptions=exceptions,
+            on_error=lambda _args, e: (logger or get_logger()).error(f"Error in {func.__name__}: {e}", exc_info=True),
+            default_return=default_return,
+            raise_on_error=raise_on_error,
+        )
 
     return decorator
@@ -5,16 +5,27 @@ Logging Module
 提供统一的日志记录功能，支持多级别日志、文件输出、彩色控制台输出
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
 
 from loguru import logger
 
 
+class _StdoutProxy:
+    """转发到当前 sys.stdout 的流对象，stdout 被替换（重定向、测试捕获）后 sink 仍写到新的目标。"""
+
+    def write(self, message: str) -> None:
+        sys.stdout.write(message)
+
+    def flush(self) -> None:
+        sys.stdout.flush()
+
+
 class Logger:
     """
     日志管理类
@@ -22,7 +33,7 @@ class Logger:
     封装loguru，提供配置化的日志输出
     """
 
-    _instance: Optional["Logger"] = None
+    _instance: Logger | None = None
     _lock = threading.Lock()
     _initialized: bool = False
 
@@ -31,13 +42,17 @@ class Logger:
             with cls._lock:
                 if cls._instance is None:
                     cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
         return cls._instance
 
     def __init__(self):
-        if not hasattr(self, "_initialized") or not self._initialized:
-            self._setup_logger()
-            Logger._initialized = True
+        # 单例每次 Logger()/get_logger() 都会再走 __init__；sink 只能添加一次，
+        # 否则每次调用都会 remove 并重建 stdout/文件 sink，还会新建一个日志文件
+        if self._initialized:
+            return
+        with Logger._lock:
+            if not self._initialized:
+                self._setup_logger()
+                self._initialized = True
 
     def _setup_logger(self) -> None:
         """
@@ -55,19 +70,25 @@ class Logger:
 
         logger.remove()
 
+        file_format = "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}"
+
+        # 仅在终端中输出颜色；容器/systemd 等非 TTY 环境使用纯文本格式，省去颜色标记的处理
+        isatty = getattr(sys.stdout, "isatty", None)
+        colorize = bool(isatty and isatty())
         console_format = (
             "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{message}</cyan>"
+            if colorize
+            else file_format
         )
 
-        file_format = "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}"
-
         logger.add(
-            sys.stdout,
+            _StdoutProxy(),
             format=console_format,
             level="DEBUG" if debug else log_level,
-            colorize=True,
+            colorize=colorize,
         )
 
+        # 文件写入与轮转压缩放到后台线程，调用方不再阻塞在磁盘 I/O 上
         logger.add(
             str(log_file),
             format=file_format,
@@ -75,6 +96,9 @@ class Logger:
             rotation="10 MB",
             retention="7 days",
             compression="gz",
+            enqueue=True,
+            backtrace=False,
+            diagnose=False,
         )
 
     def info(self, message: str, **kwargs) -> None:
@@ -103,9 +127,9 @@ class Logger:
 
     def success(self, message: str, **kwargs) -> None:
         """
-        Success级别日志（自定义）
+        Success级别日志（loguru 内置 SUCCESS 级别，颜色由格式化器统一处理）
         """
-        logger.info(f"<green>{message}</green>", **kwargs)
+        logger.success(message, **kwargs)
 
 
 def get_logger(*_args, **_kwargs) -> Logger:
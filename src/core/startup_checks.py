@@ -52,8 +52,9 @@ def resolve_runtime_mode() -> str:
     return "auto"
 
 
-def check_runtime_mode() -> StartupCheckResult:
-    runtime = resolve_runtime_mode()
+def check_runtime_mode(runtime: str | None = None) -> StartupCheckResult:
+    if runtime is None:
+        runtime = resolve_runtime_mode()
     return StartupCheckResult("浏览器运行时", True, f"当前运行时: {runtime}", critical=False)
 
 
@@ -236,11 +237,12 @@ def check_quote_mock_guard() -> StartupCheckResult:
         return StartupCheckResult("报价Mock门禁", False, f"检查失败: {e}", critical=True)
 
 
-def run_all_checks(skip_browser: bool = False) -> list[StartupCheckResult]:
-    """运行所有启动检查"""
-    runtime = resolve_runtime_mode()
+def run_all_checks(skip_browser: bool = False, runtime: str | None = None) -> list[StartupCheckResult]:
+    """运行所有启动检查；``runtime`` 由调用方预先解析时不再重复解析"""
+    if runtime is None:
+        runtime = resolve_runtime_mode()
     results = [
-        check_runtime_mode(),
+        check_runtime_mode(runtime),
         check_python_version(),
         check_data_directories(),
         check_database_writable(),
@@ -32,7 +32,7 @@ class MediaService:
         """
         self.config = config or get_config().media
         self.logger = get_logger()
-        self.supported_formats = self.config.get("supported_formats", ["jpg", "jpeg", "png", "webp"])
+        self.supported_formats = frozenset(self.config.get("supported_formats", ["jpg", "jpeg", "png", "webp"]))
         self.max_size = (self.config.get("max_width", 1500), self.config.get("max_height", 1500))
         self.output_format = self.config.get("output_format", "JPEG")
         self.output_quality = self.config.get("output_quality", 85)
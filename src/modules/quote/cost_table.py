@@ -6,10 +6,13 @@ Cost Table Loader for Quote Service
 from __future__ import annotations
 
 import csv
+import fnmatch
 import io
+import os
 import re
 import zipfile
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from xml.etree import ElementTree as ET
@@ -172,6 +175,15 @@ class CostRecord:
     source_sheet: str = ""
 
 
+@lru_cache(maxsize=16)
+def _compile_name_patterns(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """把纯文件名通配符合并为一个正则；含目录层级的模式返回 None，交回 glob 处理。"""
+    if any("/" in pattern or os.sep in pattern or "**" in pattern for pattern in patterns):
+        return None
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns), flags)
+
+
 class CostTableRepository:
     """加载并查询成本价表（xlsx/csv）。"""
 
@@ -262,8 +274,7 @@ class CostTableRepository:
         return []
 
     def get_stats(self, max_files: int = 30) -> dict:
-        self._reload_if_needed()
-        files = self._collect_files()[:max_files]
+        files = self._reload_if_needed()[:max_files]
         couriers = set(r.courier for r in self._records if r.courier)
         origins = set(r.origin for r in self._records if r.origin)
         destinations = set(r.destination for r in self._records if r.destination)
@@ -276,11 +287,11 @@ class CostTableRepository:
             "files": [str(f.name) for f in files],
         }
 
-    def _reload_if_needed(self) -> None:
+    def _reload_if_needed(self) -> list[Path]:
         files = self._collect_files()
         signature = self._build_signature(files)
         if signature == self._signature:
-            return
+            return files
 
         records: list[CostRecord] = []
         for path in files:
@@ -293,6 +304,7 @@ class CostTableRepository:
         self._records = records
         self._signature = signature
         self._rebuild_indexes(records)
+        return files
 
     def _collect_files(self) -> list[Path]:
         if self.table_dir.is_file():
@@ -300,6 +312,14 @@ class CostTableRepository:
         if not self.table_dir.exists():
             return []
 
+        matcher = _compile_name_patterns(tuple(self.include_patterns))
+        if matcher is not None:
+            # 单次 scandir 遍历，按文件名匹配全部模式；DirEntry.is_file 复用目录项类型，无需逐个 stat
+            with os.scandir(self.table_dir) as entries:
+                return sorted(
+                    self.table_dir / entry.name for entry in entries if matcher.match(entry.name) and entry.is_file()
+                )
+
         files: list[Path] = []
         for pattern in self.include_patterns:
             files.extend(self.table_dir.glob(pattern))
@@ -6,9 +6,15 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 import pytest
 
+import src.core.cookie_health as cookie_health
 from src.core.cookie_health import CookieHealthChecker
 
 
+@pytest.fixture(autouse=True)
+def _reset_shared_client(monkeypatch):
+    monkeypatch.setattr(cookie_health, "_SHARED_CLIENT", None)
+
+
 class TestCookieHealthChecker:
     def test_cookie_text_setter(self):
         checker = CookieHealthChecker("original_cookie")
@@ -54,6 +60,7 @@ class TestCookieHealthChecker:
         checker = CookieHealthChecker("valid_cookie")
         mock_resp = MagicMock()
         mock_resp.status_code = 200
+        mock_resp.content = b"<html></html>"
         mock_client = MagicMock()
         mock_client.__enter__ = MagicMock(return_value=mock_client)
         mock_client.__exit__ = MagicMock(return_value=False)
@@ -144,6 +151,7 @@ class TestCookieHealthChecker:
 
         mock_resp = MagicMock()
         mock_resp.status_code = 200
+        mock_resp.content = b"<html></html>"
         mock_async_client = AsyncMock()
         mock_async_client.__aenter__ = AsyncMock(return_value=mock_async_client)
         mock_async_client.__aexit__ = AsyncMock(return_value=False)
@@ -200,6 +208,7 @@ class TestCookieHealthChecker:
 
         mock_resp = MagicMock()
         mock_resp.status_code = 200
+        mock_resp.content = b"<html></html>"
         mock_async_client = AsyncMock()
         mock_async_client.__aenter__ = AsyncMock(return_value=mock_async_client)
         mock_async_client.__aexit__ = AsyncMock(return_value=False)
@@ -236,6 +245,7 @@ class TestCookieHealthChecker:
         checker._last_healthy = False
         mock_resp = MagicMock()
         mock_resp.status_code = 200
+        mock_resp.content = b"<html></html>"
         mock_async_client = AsyncMock()
         mock_async_client.__aenter__ = AsyncMock(return_value=mock_async_client)
         mock_async_client.__aexit__ = AsyncMock(return_value=False)
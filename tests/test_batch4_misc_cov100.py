@@ -290,7 +290,7 @@ class TestDoctor:
                         mock_cfg = MagicMock()
                         mock_cfg.get_section.return_value = {}
                         mock_config.return_value = mock_cfg
-                        with patch("src.core.doctor.CostTableRepository"):
+                        with patch("src.modules.quote.cost_table.CostTableRepository"):
                             with patch.dict(os.environ, {"XIANYU_COOKIE_1": "a" * 50}):
                                 with patch.object(ch_mod, "CookieHealthChecker", side_effect=raise_on_init):
                                     checks = _extra_checks(skip_quote=False)
@@ -335,19 +335,22 @@ class TestConfig:
         obj._initialized = False
         return obj
 
-    def test_load_env_file(self):
+    def test_load_env_file(self, tmp_path, monkeypatch):
         config = self._make_config_stub()
-        with patch("os.path.exists", side_effect=lambda p: str(p) == ".env"):
-            with patch("src.core.config.load_dotenv") as mock_dotenv:
-                config._load_env_file()
-                mock_dotenv.assert_called_once_with(".env", override=False)
+        (tmp_path / ".env").write_text("", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+        with patch("dotenv.load_dotenv") as mock_dotenv:
+            config._load_env_file()
+            mock_dotenv.assert_called_once_with(".env", override=False)
 
-    def test_load_env_file_config_dir(self):
+    def test_load_env_file_config_dir(self, tmp_path, monkeypatch):
         config = self._make_config_stub()
-        with patch("os.path.exists", side_effect=lambda p: p == "config/.env"):
-            with patch("src.core.config.load_dotenv") as mock_dotenv:
-                config._load_env_file()
-                mock_dotenv.assert_called_once_with("config/.env", override=False)
+        (tmp_path / "config").mkdir()
+        (tmp_path / "config" / ".env").write_text("", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+        with patch("dotenv.load_dotenv") as mock_dotenv:
+            config._load_env_file()
+            mock_dotenv.assert_called_once_with("config/.env", override=False)
 
 
 class TestBrowserClient:
@@ -68,11 +68,78 @@ app:
         config.reload()
         assert config.get("app.name") == "updated_name"
 
+    def test_config_reload_reuses_validated_file(self, temp_dir, monkeypatch):
+        """测试切换回未变化的配置文件时复用已校验结果"""
+        first = temp_dir / "first.yaml"
+        first.write_text('app:\n  name: "first"\n')
+        second = temp_dir / "second.yaml"
+        second.write_text('app:\n  name: "second"\n')
+
+        config = Config(str(first))
+        config.reload(str(second))
+        monkeypatch.setattr(ConfigModel, "from_dict", MagicMock(side_effect=AssertionError("should not revalidate")))
+        config.reload(str(first))
+        assert config.get("app.name") == "first"
+
+    def test_config_reload_skips_validation_for_identical_content(self, temp_config_file, monkeypatch):
+        """测试文件被改写但内容相同时不重复校验"""
+        config = Config(str(temp_config_file))
+        temp_config_file.write_bytes(temp_config_file.read_bytes())
+        stat = temp_config_file.stat()
+        os.utime(temp_config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        monkeypatch.setattr(ConfigModel, "from_dict", MagicMock(side_effect=AssertionError("should not revalidate")))
+        config.reload()
+        assert config.get("app.name") == "xianyu-openclaw"
+
+    def test_config_section_property_refreshed_on_reload(self, temp_config_file):
+        """测试段落属性缓存会在重新加载后刷新"""
+        config = Config(str(temp_config_file))
+        assert config.app is config.app
+        assert config.app["name"] == "xianyu-openclaw"
+
+        temp_config_file.write_text('app:\n  name: "reloaded_name"\n')
+        config.reload()
+        assert config.app["name"] == "reloaded_name"
+
     def test_config_missing_file(self, temp_dir):
         """测试配置文件不存在"""
         config = Config(str(temp_dir / "nonexistent.yaml"))
         assert config.get("app.name") == "xianyu-openclaw"  # 使用默认值
 
+    def test_env_override_does_not_leak_into_defaults(self, temp_dir, monkeypatch):
+        """测试环境变量覆盖不会污染模块级默认值"""
+        missing = str(temp_dir / "nonexistent.yaml")
+        monkeypatch.setenv("MESSAGES_MAX_REPLIES_PER_RUN", "3")
+        config = Config(missing)
+        assert config.get("messages.max_replies_per_run") == 3
+
+        monkeypatch.delenv("MESSAGES_MAX_REPLIES_PER_RUN")
+        config.reload(missing)
+        assert config.get("messages.max_replies_per_run") == 10
+
+    def test_nested_default_mutation_does_not_leak(self, temp_dir):
+        """测试修改嵌套默认值不会影响下一次加载"""
+        missing = str(temp_dir / "nonexistent.yaml")
+        config = Config(missing)
+        config.browser["viewport"]["width"] = 1
+        config.messages["quote_intent_keywords"].append("extra")
+
+        config.reload(missing)
+        assert config.get("browser.viewport.width") == 1280
+        assert "extra" not in config.get("messages.quote_intent_keywords")
+
+    def test_partial_section_merges_over_fresh_defaults(self, temp_dir):
+        """测试部分覆盖的段落保留加载值，未覆盖的嵌套默认值每次加载独立"""
+        config_file = temp_dir / "partial.yaml"
+        config_file.write_text("browser:\n  headless: false\n")
+        config = Config(str(config_file))
+        assert config.get("browser.headless") is False
+        config.browser["viewport"]["width"] = 1
+
+        config.reload()
+        assert config.get("browser.viewport.width") == 1280
+
 
 class TestConfigModels:
     """配置模型测试"""
@@ -202,6 +269,15 @@ class TestConfigModels:
         assert len(config.accounts) == 1
         assert config.default_account == "account_1"
 
+    def test_config_model_subclass_from_dict(self):
+        """测试子类通过缓存的 TypeAdapter 校验并返回子类实例"""
+
+        class CustomConfig(ConfigModel):
+            pass
+
+        config = CustomConfig.from_dict({"app": {"name": "sub_app"}})
+        assert type(config) is CustomConfig
+
     def test_config_model_log_level_validation(self):
         """测试日志级别验证"""
         # 有效日志级别
@@ -294,3 +370,51 @@ ai:
         config = Config(str(config_file_with_env))
         assert config.get("ai.api_key") == "${TEST_API_KEY}"
         assert config.get("ai.base_url") == "${TEST_BASE_URL}"
+
+    def test_env_variable_embedded(self, temp_dir, monkeypatch):
+        """测试字符串内嵌的多个环境变量引用"""
+        monkeypatch.setenv("TEST_HOST", "example.com")
+        monkeypatch.setenv("TEST_PORT", "8443")
+        monkeypatch.delenv("TEST_MISSING", raising=False)
+        config_file = temp_dir / "config_embedded_env.yaml"
+        config_file.write_text(
+            """
+ai:
+  base_url: "https://${TEST_HOST}:${TEST_PORT}/v1"
+  api_key: "key-${TEST_MISSING}"
+"""
+        )
+
+        config = Config(str(config_file))
+        assert config.get("ai.base_url") == "https://example.com:8443/v1"
+        assert config.get("ai.api_key") == "key-${TEST_MISSING}"
+
+    def test_env_variable_in_nested_list(self, temp_dir, monkeypatch):
+        """测试列表内嵌套字典中的环境变量引用"""
+        monkeypatch.setenv("TEST_KEYWORD", "price")
+        config_file = temp_dir / "config_nested_env.yaml"
+        config_file.write_text(
+            """
+messages:
+  intent_rules:
+    - name: quote
+      keywords: ["${TEST_KEYWORD}", plain]
+"""
+        )
+
+        config = Config(str(config_file))
+        rule = config.get("messages.intent_rules")[0]
+        assert rule["keywords"] == ["price", "plain"]
+
+    def test_non_identifier_placeholder_left_intact(self, temp_dir):
+        """测试非变量名形式的 ${...} 原样保留"""
+        config_file = temp_dir / "config_template_env.yaml"
+        config_file.write_text(
+            """
+app:
+  name: "total ${price.toFixed(2)}"
+"""
+        )
+
+        config = Config(str(config_file))
+        assert config.get("app.name") == "total ${price.toFixed(2)}"
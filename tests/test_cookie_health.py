@@ -6,9 +6,15 @@ from unittest.mock import AsyncMock, Mock, patch
 import httpx
 import pytest
 
+import src.core.cookie_health as cookie_health
 from src.core.cookie_health import CookieHealthChecker
 
 
+@pytest.fixture(autouse=True)
+def _reset_shared_client(monkeypatch):
+    monkeypatch.setattr(cookie_health, "_SHARED_CLIENT", None)
+
+
 class TestCookieHealthChecker:
     """CookieHealthChecker 单元测试。"""
 
@@ -22,6 +28,7 @@ class TestCookieHealthChecker:
     def test_check_sync_healthy_on_200(self, monkeypatch) -> None:
         resp = Mock(spec=httpx.Response)
         resp.status_code = 200
+        resp.content = b"<html></html>"
         resp.headers = {}
 
         mock_client = Mock()
@@ -36,6 +43,52 @@ class TestCookieHealthChecker:
         assert result["healthy"] is True
         assert "有效" in result["message"]
 
+    def test_check_sync_unhealthy_on_200_login_page_body(self, monkeypatch) -> None:
+        resp = Mock(spec=httpx.Response)
+        resp.status_code = 200
+        resp.content = b'<html><script src="https://passport.goofish.com/mini_login.js"></script></html>'
+        resp.headers = {}
+
+        mock_client = Mock()
+        mock_client.get = Mock(return_value=resp)
+
+        monkeypatch.setattr(httpx, "Client", lambda **kwargs: mock_client)
+
+        checker = CookieHealthChecker(cookie_text="test_cookie=abc123")
+        result = checker.check_sync(force=True)
+        assert result["healthy"] is False
+        assert "登录页" in result["message"]
+
+    def test_check_sync_healthy_on_200_referencing_passport_domain(self, monkeypatch) -> None:
+        resp = Mock(spec=httpx.Response)
+        resp.status_code = 200
+        resp.content = b'<html><script src="https://passport.goofish.com/sdk/session.js"></script></html>'
+        resp.headers = {}
+
+        mock_client = Mock()
+        mock_client.get = Mock(return_value=resp)
+
+        monkeypatch.setattr(httpx, "Client", lambda **kwargs: mock_client)
+
+        checker = CookieHealthChecker(cookie_text="test_cookie=abc123")
+        result = checker.check_sync(force=True)
+        assert result["healthy"] is True
+
+    def test_check_sync_unhealthy_on_200_script_redirect_to_login(self, monkeypatch) -> None:
+        resp = Mock(spec=httpx.Response)
+        resp.status_code = 200
+        resp.content = b'<html><script>window.location.href = "https://passport.goofish.com/login";</script></html>'
+        resp.headers = {}
+
+        mock_client = Mock()
+        mock_client.get = Mock(return_value=resp)
+
+        monkeypatch.setattr(httpx, "Client", lambda **kwargs: mock_client)
+
+        checker = CookieHealthChecker(cookie_text="test_cookie=abc123")
+        result = checker.check_sync(force=True)
+        assert result["healthy"] is False
+
     def test_check_sync_unhealthy_on_302_to_login(self, monkeypatch) -> None:
         resp = Mock(spec=httpx.Response)
         resp.status_code = 302
@@ -69,6 +122,7 @@ class TestCookieHealthChecker:
     def test_ttl_cache_returns_cached_result(self, monkeypatch) -> None:
         resp = Mock(spec=httpx.Response)
         resp.status_code = 200
+        resp.content = b"<html></html>"
         resp.headers = {}
 
         mock_client = Mock()
@@ -88,6 +142,9 @@ class TestCookieHealthChecker:
         assert result1["healthy"] is True
         assert result2["healthy"] is True
         assert mock_client.get.call_count == 1  # only called once
+        assert result2 is result1
+        with pytest.raises(TypeError):
+            result1["healthy"] = False  # type: ignore[index]
 
     @pytest.mark.asyncio
     async def test_check_async_triggers_alert_on_state_change(self, monkeypatch) -> None:
@@ -134,6 +191,7 @@ class TestCookieHealthChecker:
         # Now make it healthy
         resp = Mock(spec=httpx.Response)
         resp.status_code = 200
+        resp.content = b"<html></html>"
         resp.headers = {}
 
         mock_async_client = AsyncMock()
@@ -149,6 +207,37 @@ class TestCookieHealthChecker:
         call_text = notifier.send_text.call_args[0][0]
         assert "恢复" in call_text
 
+    def test_check_sync_shares_client_across_checkers(self, monkeypatch) -> None:
+        resp = Mock(spec=httpx.Response)
+        resp.status_code = 200
+        resp.content = b"<html></html>"
+        resp.headers = {}
+
+        created = []
+
+        def _make_client(**kwargs):
+            client = Mock()
+            client.get = Mock(return_value=resp)
+            created.append(client)
+            return client
+
+        monkeypatch.setattr(httpx, "Client", _make_client)
+
+        first = CookieHealthChecker(cookie_text="test_cookie=abc123", timeout_seconds=5.0)
+        second = CookieHealthChecker(cookie_text="test_cookie=other", timeout_seconds=8.0)
+        first.check_sync(force=True)
+        second.check_sync(force=True)
+
+        assert len(created) == 1
+        last_call = created[0].get.call_args.kwargs
+        assert last_call["headers"] == {"Cookie": "test_cookie=other"}
+        assert last_call["timeout"] == 8.0
+
+        cookie_health._close_shared_client()
+        created[0].close.assert_called_once()
+        first.check_sync(force=True)
+        assert len(created) == 2
+
     def test_cookie_setter_clears_cache(self) -> None:
         checker = CookieHealthChecker(cookie_text="old_cookie")
         checker._last_check_ts = time.time()
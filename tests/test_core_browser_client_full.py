@@ -78,6 +78,23 @@ async def test_connect_503_start_and_error(monkeypatch):
     assert await c2.connect() is False
 
 
+@pytest.mark.asyncio
+async def test_connect_after_start_returns_once_ready(monkeypatch):
+    c = BrowserClient()
+    fake = _Client()
+    sleep = AsyncMock()
+    monkeypatch.setattr("src.core.browser_client.httpx.AsyncClient", lambda **_: fake)
+    monkeypatch.setattr("src.core.browser_client.asyncio.sleep", sleep)
+
+    fake.get.side_effect = [_Resp(503), _Resp(503), _Resp(200)]
+    fake.post.return_value = _Resp(200)
+    assert await c.connect() is True
+    assert c.state == BrowserState.CONNECTED
+    assert sleep.await_count == 2
+    probe_timeouts = [call.kwargs["timeout"] for call in fake.get.call_args_list[1:]]
+    assert probe_timeouts and all(0 < t <= 2.0 for t in probe_timeouts)
+
+
 @pytest.mark.asyncio
 async def test_tab_navigation_and_actions():
     c = BrowserClient({"retry_times": 2, "delay_min": 0.0, "delay_max": 0.0})
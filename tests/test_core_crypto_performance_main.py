@@ -83,25 +83,19 @@ async def test_file_cache_and_monitor(tmp_path):
 
 def test_crypto_paths(monkeypatch, tmp_path):
     monkeypatch.setattr(crypto, "_KEY_FILE", str(tmp_path / ".k"))
+    crypto._reset_key_cache()
 
     # derive and env-key path
     monkeypatch.setenv("ENCRYPTION_KEY", "pass")
     key = crypto._get_or_create_key()
     assert isinstance(key, bytes)
 
-    # no cryptography fallback via fake import
-    real_import = __import__
-
-    def fake_import(name, *args, **kwargs):
-        if name == "cryptography.fernet":
-            raise ImportError("nope")
-        return real_import(name, *args, **kwargs)
-
-    monkeypatch.setattr("builtins.__import__", fake_import)
+    # no cryptography fallback
+    monkeypatch.setattr(crypto, "_HAS_CRYPTO", False)
     assert crypto.encrypt_value("abc") == "abc"
     assert crypto.decrypt_value("abc") == "abc"
 
-    monkeypatch.setattr("builtins.__import__", real_import)
+    monkeypatch.setattr(crypto, "_HAS_CRYPTO", True)
 
     # ensure helpers
     assert crypto.is_encrypted("gAAAAA123")
@@ -110,6 +104,24 @@ def test_crypto_paths(monkeypatch, tmp_path):
     assert crypto.ensure_decrypted("") == ""
 
 
+def test_crypto_fernet_follows_current_env_key(monkeypatch, tmp_path):
+    monkeypatch.setattr(crypto, "_KEY_FILE", str(tmp_path / ".k"))
+    monkeypatch.setenv("ENCRYPTION_KEY", "first")
+    crypto._reset_key_cache()
+
+    token = crypto.encrypt_value("secret")
+    assert crypto._get_fernet() is crypto._get_fernet()
+
+    # 环境变量变化（如 .env 晚于首次调用加载）后改用新密钥，旧密文无法解密
+    monkeypatch.setenv("ENCRYPTION_KEY", "second")
+    assert crypto.decrypt_value(token) == token
+
+    monkeypatch.setenv("ENCRYPTION_KEY", "first")
+    assert crypto.decrypt_value(token) == "secret"
+    assert not (tmp_path / ".k").exists()
+    crypto._reset_key_cache()
+
+
 def test_main_and_module_entry(monkeypatch):
     import src.main as m
 
@@ -2,6 +2,8 @@
 
 import json
 
+import httpx
+
 import src.core.doctor as doctor
 from src.core.doctor import run_doctor
 from src.core.startup_checks import StartupCheckResult
@@ -10,11 +12,11 @@ from src.core.startup_checks import StartupCheckResult
 def test_doctor_report_not_ready_when_critical_check_fails(monkeypatch) -> None:
     monkeypatch.setattr(
         "src.core.doctor.run_all_checks",
-        lambda skip_browser=False: [  # noqa: ARG005
+        lambda skip_browser=False, runtime=None: [  # noqa: ARG005
             StartupCheckResult("Legacy Browser Gateway", False, "无法连接", critical=True),
         ],
     )
-    monkeypatch.setattr("src.core.doctor._extra_checks", lambda skip_quote=False: [])  # noqa: ARG005
+    monkeypatch.setattr("src.core.doctor._extra_checks", lambda skip_quote=False, **_kwargs: [])  # noqa: ARG005
 
     report = run_doctor(skip_gateway=False, skip_quote=True)
 
@@ -26,13 +28,13 @@ def test_doctor_report_not_ready_when_critical_check_fails(monkeypatch) -> None:
 def test_doctor_report_ready_with_warning_only(monkeypatch) -> None:
     monkeypatch.setattr(
         "src.core.doctor.run_all_checks",
-        lambda skip_browser=False: [  # noqa: ARG005
+        lambda skip_browser=False, runtime=None: [  # noqa: ARG005
             StartupCheckResult("Python版本", True, "ok", critical=True),
         ],
     )
     monkeypatch.setattr(
         "src.core.doctor._extra_checks",
-        lambda skip_quote=False: [  # noqa: ARG005
+        lambda skip_quote=False, **_kwargs: [  # noqa: ARG005
             {
                 "name": "AI服务",
                 "passed": False,
@@ -60,20 +62,15 @@ def test_extra_checks_contains_dashboard_daemon_status(monkeypatch) -> None:
                 return {"fast_reply_enabled": True, "reply_target_seconds": 3.0}
             return default if default is not None else {}
 
-    class _Resp:
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            _ = (exc_type, exc, tb)
-            return False
-
-        def read(self) -> bytes:
-            return json.dumps({"service_status": "running"}).encode("utf-8")
+    class _Client:
+        @staticmethod
+        def get(url: str) -> httpx.Response:
+            body = json.dumps({"service_status": "running"}).encode("utf-8")
+            return httpx.Response(200, content=body, request=httpx.Request("GET", url))
 
     monkeypatch.setattr(doctor, "get_config", lambda: _Cfg())
     monkeypatch.setattr(doctor, "_check_port_open", lambda port, host="127.0.0.1", timeout=0.3: True)  # noqa: ARG005
-    monkeypatch.setattr(doctor.urllib.request, "urlopen", lambda *args, **kwargs: _Resp())
+    monkeypatch.setattr(doctor, "_get_http_client", lambda: _Client())
 
     checks = doctor._extra_checks(skip_quote=True)
     dashboard_check = next(item for item in checks if item["name"] == "Dashboard守护状态")
@@ -102,3 +99,136 @@ def test_extra_checks_dashboard_daemon_status_failed_when_port_closed(monkeypatc
 
     assert dashboard_check["passed"] is False
     assert "端口未监听" in dashboard_check["message"]
+
+
+def test_check_ports_bulk_probes_ports_concurrently(monkeypatch) -> None:
+    import threading
+
+    barrier = threading.Barrier(2, timeout=2.0)
+
+    def _probe(port: int, host: str = "127.0.0.1", timeout: float = 0.3) -> bool:
+        barrier.wait()
+        return port == 8091
+
+    monkeypatch.setattr(doctor, "_check_port_open", _probe)
+
+    assert doctor._check_ports_bulk([5173, 8091, 8091]) == {5173: False, 8091: True}
+
+
+def test_extra_checks_dashboard_daemon_status_reports_http_error(monkeypatch) -> None:
+    class _Cfg:
+        @staticmethod
+        def get_section(name: str, default=None):
+            return default if default is not None else {}
+
+    class _Client:
+        @staticmethod
+        def get(url: str) -> httpx.Response:
+            return httpx.Response(503, request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(doctor, "get_config", lambda: _Cfg())
+    monkeypatch.setattr(doctor, "_check_port_open", lambda port, host="127.0.0.1", timeout=0.3: True)
+    monkeypatch.setattr(doctor, "_get_http_client", lambda: _Client())
+
+    checks = doctor._extra_checks(skip_quote=True)
+    dashboard_check = next(item for item in checks if item["name"] == "Dashboard守护状态")
+
+    assert dashboard_check["passed"] is False
+    assert "Dashboard API 不可用" in dashboard_check["message"]
+    assert "503" in dashboard_check["message"]
+
+
+def test_extra_checks_config_failure_fails_sla_and_quote_once(monkeypatch) -> None:
+    calls = []
+
+    def _broken_config():
+        calls.append(1)
+        raise RuntimeError("cfg broken")
+
+    monkeypatch.delenv("XIANYU_COOKIE_1", raising=False)
+    monkeypatch.setattr(doctor, "get_config", _broken_config)
+    monkeypatch.setattr(doctor, "_check_port_open", lambda port, host="127.0.0.1", timeout=0.3: False)
+
+    checks = doctor._extra_checks(skip_quote=False)
+    failed = {item["name"]: item["message"] for item in checks if not item["passed"]}
+
+    assert calls == [1]
+    assert failed["消息首响SLA"] == "检查失败: cfg broken"
+    assert failed["自动报价成本源"] == "检查失败: cfg broken"
+
+
+def test_get_http_client_is_shared(monkeypatch) -> None:
+    monkeypatch.setattr(doctor, "_HTTP_CLIENT", None)
+    client = doctor._get_http_client()
+    try:
+        assert doctor._get_http_client() is client
+    finally:
+        client.close()
+
+
+def test_doctor_import_defers_quote_module() -> None:
+    import subprocess
+    import sys
+
+    code = "import sys; import src.core.doctor; print('src.modules' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.split()
+
+    assert out == ["False"]
+
+
+def test_run_doctor_runs_startup_and_extra_checks_concurrently(monkeypatch) -> None:
+    import threading
+
+    barrier = threading.Barrier(2, timeout=2.0)
+
+    def _startup(skip_browser=False, runtime=None):
+        barrier.wait()
+        return [StartupCheckResult("Python版本", True, "ok", critical=True)]
+
+    def _extra(skip_quote=False, runtime=None, config_state=None):
+        barrier.wait()
+        return [{"name": "AI服务", "passed": True, "critical": False, "message": "ok", "suggestion": "", "meta": {}}]
+
+    monkeypatch.setattr("src.core.doctor.run_all_checks", _startup)
+    monkeypatch.setattr("src.core.doctor._extra_checks", _extra)
+
+    report = run_doctor(skip_gateway=True, skip_quote=True)
+
+    assert [c["name"] for c in report["checks"]] == ["Python版本", "AI服务"]
+    assert report["ready"] is True
+
+
+def test_run_doctor_resolves_runtime_and_config_before_submitting(monkeypatch) -> None:
+    import threading
+
+    main_thread = threading.current_thread()
+    resolved = []
+    seen = {}
+    cfg = object()
+
+    def _resolve():
+        resolved.append(threading.current_thread() is main_thread)
+        return "lite"
+
+    def _get_config():
+        resolved.append(threading.current_thread() is main_thread)
+        return cfg
+
+    def _startup(skip_browser=False, runtime=None):
+        seen["startup_runtime"] = runtime
+        return []
+
+    def _extra(skip_quote=False, runtime=None, config_state=None):
+        seen["extra_runtime"] = runtime
+        seen["config_state"] = config_state
+        return []
+
+    monkeypatch.setattr(doctor, "resolve_runtime_mode", _resolve)
+    monkeypatch.setattr(doctor, "get_config", _get_config)
+    monkeypatch.setattr(doctor, "run_all_checks", _startup)
+    monkeypatch.setattr(doctor, "_extra_checks", _extra)
+
+    run_doctor(skip_gateway=True, skip_quote=True)
+
+    assert resolved == [True, True]
+    assert seen == {"startup_runtime": "lite", "extra_runtime": "lite", "config_state": (cfg, None)}
@@ -505,3 +505,30 @@ def test_targeted_safe_execute_sync_raise_and_retry_sync_final_attempt_and_handl
     with pytest.raises(ValueError, match="sync-value"):
         sync_value_error()
     handle_logger.error.assert_called_once()
+
+
+def test_decorators_resolve_default_logger_lazily():
+    fake_logger = Mock()
+    with patch("src.core.error_handler.get_logger", return_value=fake_logger) as get_logger_mock:
+
+        @safe_execute()
+        def fail():
+            raise RuntimeError("lazy")
+
+        @log_execution_time()
+        def ok():
+            return 1
+
+        @handle_errors()
+        def fail_again():
+            raise RuntimeError("lazy")
+
+        get_logger_mock.assert_not_called()
+
+        assert fail() is None
+        assert ok() == 1
+        assert fail_again() is None
+
+    assert get_logger_mock.call_count == 3
+    fake_logger.debug.assert_called()
+    fake_logger.error.assert_called_once()
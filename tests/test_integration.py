@@ -104,6 +104,19 @@ app:
         logger.success("Test success message")
 
 
+    def test_logger_setup_runs_once(self, monkeypatch):
+        """测试重复获取日志单例不会重建 sink"""
+        from src.core.logger import Logger, get_logger
+
+        first = get_logger()
+        calls = []
+        monkeypatch.setattr(Logger, "_setup_logger", lambda self: calls.append(self))
+
+        assert Logger() is first
+        assert get_logger() is first
+        assert calls == []
+
+
 class TestErrorHandlerIntegration:
     """错误处理集成测试"""
 
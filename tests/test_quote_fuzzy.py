@@ -101,3 +101,18 @@ def test_excel_adaptive_import(tmp_path: Path) -> None:
     assert row.origin == "杭州"
     assert row.destination == "广州"
     assert row.source_file == "韵达报价.xlsx"
+
+
+def test_collect_files_matches_all_patterns_in_one_scan(tmp_path: Path) -> None:
+    (tmp_path / "b.csv").write_text("x", encoding="utf-8")
+    (tmp_path / "a.xlsx").write_bytes(b"x")
+    (tmp_path / "notes.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "dir.csv").mkdir()
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "c.csv").write_text("x", encoding="utf-8")
+
+    repo = CostTableRepository(table_dir=tmp_path, include_patterns=["*.xlsx", "*.csv"])
+    assert [p.name for p in repo._collect_files()] == ["a.xlsx", "b.csv"]
+
+    nested = CostTableRepository(table_dir=tmp_path, include_patterns=["sub/*.csv"])
+    assert nested._collect_files() == [tmp_path / "sub" / "c.csv"]
@@ -463,7 +463,7 @@ def test_startup_checks_and_service_container_extra(monkeypatch, tmp_path):
     assert sc.check_lite_browser_dependency().passed is False
 
     monkeypatch.setattr(sc, "resolve_runtime_mode", lambda: "pro")
-    monkeypatch.setattr(sc, "check_runtime_mode", lambda: sc.StartupCheckResult("浏览器运行时", True, "pro", False))
+    monkeypatch.setattr(sc, "check_runtime_mode", lambda *_: sc.StartupCheckResult("浏览器运行时", True, "pro", False))
     monkeypatch.setattr(sc, "check_python_version", lambda: sc.StartupCheckResult("Python版本", True, "ok", True))
     monkeypatch.setattr(sc, "check_data_directories", lambda: sc.StartupCheckResult("数据目录", True, "ok", True))
     monkeypatch.setattr(sc, "check_database_writable", lambda: sc.StartupCheckResult("数据库", True, "ok", True))
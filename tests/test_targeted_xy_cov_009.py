@@ -4,7 +4,9 @@ import asyncio
 import socket
 from pathlib import Path
 
+import httpx
 import pytest
+import yaml
 
 import src.core.config as cfg_mod
 import src.core.doctor as doctor
@@ -103,10 +105,11 @@ def test_doctor_port_open_and_urlerror_branch(monkeypatch) -> None:
     monkeypatch.setattr(doctor.Path, "exists", lambda self: True)
     monkeypatch.setattr(doctor, "_check_port_open", lambda p, **_k: p == 8091)
 
-    def _urlerr(*_a, **_k):
-        raise doctor.urllib.error.URLError("bad")
+    class _Client:
+        def get(self, *_a, **_k):
+            raise httpx.ConnectError("bad")
 
-    monkeypatch.setattr(doctor.urllib.request, "urlopen", _urlerr)
+    monkeypatch.setattr(doctor, "_get_http_client", lambda: _Client())
 
     class _Cfg:
         def get_section(self, *_a, **_k):
@@ -128,7 +131,9 @@ def test_config_missing_lines(monkeypatch, tmp_path: Path) -> None:
     assert called["v"] is True
 
     c._find_config_file = Config._find_config_file.__get__(c, Config)
-    monkeypatch.setattr(cfg_mod.os.path, "exists", lambda _p: False)
+    empty_dir = tmp_path / "empty"
+    empty_dir.mkdir()
+    monkeypatch.chdir(empty_dir)
     assert c._find_config_file() is None
 
     bad = tmp_path / "bad.yaml"
@@ -138,7 +143,7 @@ def test_config_missing_lines(monkeypatch, tmp_path: Path) -> None:
     class _YErr(Exception):
         pass
 
-    monkeypatch.setattr(_cfg.yaml, "safe_load", lambda *_a, **_k: (_ for _ in ()).throw(_cfg.yaml.YAMLError("boom")))
+    monkeypatch.setattr(yaml, "load", lambda *_a, **_k: (_ for _ in ()).throw(yaml.YAMLError("boom")))
     with pytest.raises(ConfigError, match="Invalid YAML"):
         c._load_yaml_config(str(bad))
 
@@ -1,9 +1,10 @@
 import json
 from types import SimpleNamespace
 
+import httpx
 import pytest
+import yaml
 
-import src.core.config as config_module
 import src.core.doctor as doctor
 import src.modules.content.service as content_module
 from src.core.config import Config
@@ -14,10 +15,8 @@ from src.modules.content.service import ContentService
 @pytest.fixture
 def reset_config_singleton():
     Config._instance = None
-    config_module.get_config.cache_clear()
     yield
     Config._instance = None
-    config_module.get_config.cache_clear()
 
 
 def test_doctor_check_port_open_invalid_and_oserror(monkeypatch):
@@ -35,17 +34,13 @@ def test_doctor_extra_checks_non_lite_quote_needed_and_api_payload_missing(monke
     monkeypatch.setattr(doctor.Path, "exists", lambda self: True)
     monkeypatch.setattr(doctor, "_check_port_open", lambda *_a, **_k: True)
 
-    class _Resp:
-        def __enter__(self):
-            return self
+    class _Client:
+        def get(self, url):
+            return httpx.Response(
+                200, content=json.dumps({"ok": True}).encode("utf-8"), request=httpx.Request("GET", url)
+            )
 
-        def __exit__(self, *_args):
-            return False
-
-        def read(self):
-            return json.dumps({"ok": True}).encode("utf-8")
-
-    monkeypatch.setattr(doctor.urllib.request, "urlopen", lambda *_a, **_k: _Resp())
+    monkeypatch.setattr(doctor, "_get_http_client", lambda: _Client())
 
     class _Cfg:
         def get_section(self, section, default=None):
@@ -69,7 +64,7 @@ def test_doctor_extra_checks_non_lite_quote_needed_and_api_payload_missing(monke
             return {"total_records": 0, "files": ["cost.csv"]}
 
     monkeypatch.setattr(doctor, "get_config", lambda: _Cfg())
-    monkeypatch.setattr(doctor, "CostTableRepository", _Repo)
+    monkeypatch.setattr("src.modules.quote.cost_table.CostTableRepository", _Repo)
 
     checks = doctor._extra_checks(skip_quote=False)
 
@@ -92,11 +87,7 @@ def test_doctor_extra_checks_sla_and_quote_exceptions(monkeypatch):
     monkeypatch.setattr(doctor.Path, "exists", lambda self: True)
     monkeypatch.setattr(doctor, "_check_port_open", lambda *_a, **_k: False)
 
-    monkeypatch.setattr(
-        doctor.urllib.request,
-        "urlopen",
-        lambda *_a, **_k: (_ for _ in ()).throw(doctor.urllib.error.URLError("unreachable")),
-    )
+    monkeypatch.setattr(doctor, "_get_http_client", lambda: (_ for _ in ()).throw(httpx.ConnectError("unreachable")))
 
     monkeypatch.setattr(doctor, "get_config", lambda: (_ for _ in ()).throw(RuntimeError("cfg broken")))
     checks = doctor._extra_checks(skip_quote=True)
@@ -120,7 +111,7 @@ def test_doctor_extra_checks_sla_and_quote_exceptions(monkeypatch):
             raise RuntimeError("table read failed")
 
     monkeypatch.setattr(doctor, "get_config", lambda: _Cfg2())
-    monkeypatch.setattr(doctor, "CostTableRepository", _BadRepo)
+    monkeypatch.setattr("src.modules.quote.cost_table.CostTableRepository", _BadRepo)
 
     checks2 = doctor._extra_checks(skip_quote=False)
     quote = next(c for c in checks2 if c["name"] == "自动报价成本源")
@@ -142,7 +133,7 @@ def test_config_load_yaml_validation_error_and_file_errors(tmp_path, reset_confi
 
     normal_file = tmp_path / "normal.yaml"
     normal_file.write_text("app:\n  name: demo\n", encoding="utf-8")
-    monkeypatch.setattr(config_module.yaml, "safe_load", lambda *_a, **_k: (_ for _ in ()).throw(RuntimeError("boom")))
+    monkeypatch.setattr(yaml, "load", lambda *_a, **_k: (_ for _ in ()).throw(RuntimeError("boom")))
     with pytest.raises(ConfigError):
         cfg._load_yaml_config(str(normal_file))
 
@@ -229,10 +220,11 @@ def test_doctor_extra_checks_dashboard_api_unknown_exception(monkeypatch):
     monkeypatch.setattr(doctor.Path, "exists", lambda self: True)
     monkeypatch.setattr(doctor, "_check_port_open", lambda *_a, **_k: True)
 
-    def _boom(*_a, **_k):
-        raise RuntimeError("json parse failed")
+    class _Client:
+        def get(self, *_a, **_k):
+            raise RuntimeError("json parse failed")
 
-    monkeypatch.setattr(doctor.urllib.request, "urlopen", _boom)
+    monkeypatch.setattr(doctor, "_get_http_client", lambda: _Client())
 
     class _Cfg:
         def get_section(self, section, default=None):
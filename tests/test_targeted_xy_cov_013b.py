@@ -1,4 +1,3 @@
-import types
 from unittest.mock import Mock
 
 import httpx
@@ -129,6 +128,7 @@ def test_crypto_more_key_and_decrypt_branches(monkeypatch, tmp_path):
     key_file = tmp_path / ".enc_key"
     monkeypatch.setattr(crypto, "_KEY_FILE", str(key_file))
     monkeypatch.delenv("ENCRYPTION_KEY", raising=False)
+    crypto._reset_key_cache()
 
     # key from existing file
     key_file.write_bytes(b"abc123\n")
@@ -136,22 +136,14 @@ def test_crypto_more_key_and_decrypt_branches(monkeypatch, tmp_path):
 
     # key generated from cryptography branch
     key_file.unlink()
+    crypto._reset_key_cache()
 
     class DummyFernet:
         @staticmethod
         def generate_key():
             return b"k" * 44
 
-    import builtins
-
-    real_import = builtins.__import__
-
-    def fake_import(name, *args, **kwargs):
-        if name == "cryptography.fernet":
-            return types.SimpleNamespace(Fernet=DummyFernet)
-        return real_import(name, *args, **kwargs)
-
-    monkeypatch.setattr(builtins, "__import__", fake_import)
+    monkeypatch.setattr(crypto, "Fernet", DummyFernet)
     generated = crypto._get_or_create_key()
     assert generated == b"k" * 44
     assert key_file.read_bytes() == b"k" * 44
@@ -163,15 +155,11 @@ def test_crypto_more_key_and_decrypt_branches(monkeypatch, tmp_path):
         def decrypt(self, _v):
             raise ValueError("bad-decrypt")
 
-    def fake_import2(name, *args, **kwargs):
-        if name == "cryptography.fernet":
-            return types.SimpleNamespace(Fernet=BadDecryptFernet)
-        return real_import(name, *args, **kwargs)
-
-    monkeypatch.setattr(builtins, "__import__", fake_import2)
+    crypto._reset_key_cache()
+    monkeypatch.setattr(crypto, "Fernet", BadDecryptFernet)
     assert crypto.decrypt_value("gAAAAA-token") == "gAAAAA-token"
 
-    monkeypatch.setattr(builtins, "__import__", real_import)
+    crypto._reset_key_cache()
 
     # helper branches
     monkeypatch.setattr(crypto, "encrypt_value", lambda v: f"enc:{v}")
@@ -80,21 +80,14 @@ def test_crypto_get_or_create_key_importerror_fallback(monkeypatch, tmp_path: Pa
     key_file = tmp_path / ".encryption_key"
     monkeypatch.setattr(crypto, "_KEY_FILE", str(key_file))
     monkeypatch.delenv("ENCRYPTION_KEY", raising=False)
+    crypto._reset_key_cache()
 
-    import builtins
-
-    real_import = builtins.__import__
-
-    def fake_import(name, *args, **kwargs):
-        if name == "cryptography.fernet":
-            raise ImportError("no-crypto")
-        return real_import(name, *args, **kwargs)
-
-    monkeypatch.setattr(builtins, "__import__", fake_import)
+    monkeypatch.setattr(crypto, "_HAS_CRYPTO", False)
     key = crypto._get_or_create_key()
     assert isinstance(key, bytes)
     assert key_file.exists()
     assert len(key) == 44
+    crypto._reset_key_cache()
 
 
 def test_excel_import_targeted_branch_matrix(monkeypatch, tmp_path: Path):